@@ -62,16 +62,19 @@ def edmi_post_process(packet: BytesLike) -> bytes:
             o += 1
     return bytes(out[:o])
 
-def edmi_pre_process(packet: BytesLike) -> bytes:
+def edmi_pre_process(packet: BytesLike) -> memoryview:
     """
     Reverse of edmi_post_process:
     - If a DLE byte is seen, consume next byte and output (next - 0x40).
     - Otherwise output the byte as-is.
+
+    Returns a memoryview over the de-stuffed buffer so parsers can slice
+    fields without copying. Call .tobytes() where real bytes are needed.
     """
     mv = packet if isinstance(packet, memoryview) else memoryview(packet)
     n = mv.nbytes
     if n == 0:
-        return b""
+        return memoryview(b"")
 
     out = bytearray(n)  # output never longer than input
     out_mv = memoryview(out)
@@ -95,8 +98,65 @@ def edmi_pre_process(packet: BytesLike) -> bytes:
             o += 1
             i += 1
 
-    return out_mv[:o].tobytes()
+    return out_mv[:o]
+
+
+
+_DLE_BYTE = bytes((EDMI_DLE_IDEN,))
+_ETX_BYTE = bytes((EDMI_ETX_IDEN,))
+_CRC_BE = struct.Struct(">H")
+_SINGLE_BYTES = tuple(bytes((b,)) for b in range(256))
+
+
+def edmi_unpack_frame(packet: BytesLike) -> tuple[memoryview, EDMI_ERROR_CODE]:
+    """
+    De-stuff a received frame and check its CRC in the same pass.
+
+    Unescaped runs between DLE bytes are copied and fed to crc_hqx as whole
+    slices. Running CRC-16/XMODEM over STX..payload plus the big-endian CRC
+    leaves a residue of 0, so the check is a single comparison at the end.
 
+    Returns (payload, err) where payload is what edmi_pre_process would
+    return and err is NONE, RESPONSE_WRONG_LENGTH or RESPONSE_CRC_ERROR.
+    """
+    raw = packet.tobytes() if isinstance(packet, memoryview) else bytes(packet)
+    n = len(raw)
+    if n < 4 or raw[0] != EDMI_STX_IDEN or raw[-1] != EDMI_ETX_IDEN:
+        try:
+            payload = edmi_pre_process(raw)
+        except ValueError:  # DLE as the last byte
+            payload = memoryview(raw)
+        return payload, EDMI_ERROR_CODE.RESPONSE_WRONG_LENGTH
+
+    body_end = n - 1  # ETX is not covered by the CRC
+    out = bytearray()
+    crc = 0
+    i = 0
+    while True:
+        j = raw.find(_DLE_BYTE, i, body_end)
+        if j < 0:
+            run = raw[i:body_end]
+            out += run
+            crc = binascii.crc_hqx(run, crc)
+            break
+        if j + 1 >= body_end:
+            # DLE right before ETX: the escaped byte is missing.
+            out += raw[i:j]
+            return memoryview(out), EDMI_ERROR_CODE.RESPONSE_WRONG_LENGTH
+        run = raw[i:j]
+        out += run
+        crc = binascii.crc_hqx(run, crc)
+        b = _SINGLE_BYTES[(raw[j + 1] - EDMI_IDEN_CORRECTOR) & 0xFF]
+        out += b
+        crc = binascii.crc_hqx(b, crc)
+        i = j + 2
+    out.append(EDMI_ETX_IDEN)
+
+    if len(out) < 4:
+        return memoryview(out), EDMI_ERROR_CODE.RESPONSE_WRONG_LENGTH
+    if crc != 0:
+        return memoryview(out), EDMI_ERROR_CODE.RESPONSE_CRC_ERROR
+    return memoryview(out), EDMI_ERROR_CODE.NONE
 
 
 def edmi_validate_crc(frame: BytesLike) -> EDMI_ERROR_CODE:
@@ -109,8 +169,8 @@ def edmi_validate_crc(frame: BytesLike) -> EDMI_ERROR_CODE:
 
     Behavior:
         - Verifies STX / ETX
-        - Computes CRC over STX .. payload
-        - Compares with received CRC
+        - Runs CRC-16/XMODEM (poly 0x1021, init 0, binascii.crc_hqx) over
+          STX .. payload .. CRC; a correct big-endian CRC leaves residue 0
         - Does NOT modify or strip data
 
     Returns:
@@ -127,15 +187,8 @@ def edmi_validate_crc(frame: BytesLike) -> EDMI_ERROR_CODE:
     if mv[0] != EDMI_STX_IDEN or mv[-1] != EDMI_ETX_IDEN:
         return EDMI_ERROR_CODE.RESPONSE_WRONG_LENGTH
 
-    # Data over which CRC is calculated: STX .. payload (exclude CRC and ETX)
-    data = mv[:-3]
-
-    # Received CRC is the two bytes before ETX (big-endian)
-    recv_crc = (mv[-3] << 8) | mv[-2]
-
-    calc_crc = binascii.crc_hqx(data, 0) & 0xFFFF
-
-    if calc_crc != recv_crc:
+    # STX .. payload .. CRC(2), i.e. everything but ETX, in one C call.
+    if binascii.crc_hqx(mv[:-1], 0) != 0:
         return EDMI_ERROR_CODE.RESPONSE_CRC_ERROR
 
     return EDMI_ERROR_CODE.NONE
@@ -186,27 +239,13 @@ def edmi_begin_init_packet(
 
 def edmi_end_init_packet(packet: BytesLike) -> bytes:
     mv = packet if isinstance(packet, memoryview) else memoryview(packet)
-    n = len(mv)
-
-    # Compute CRC over current packet (init=0), returns int
-    crc = binascii.crc_hqx(mv.tobytes() if not mv.contiguous else mv, 0) & 0xFFFF
-
-    # Append CRC (big-endian) using memory writes
-    with_crc = bytearray(n + 2)
-    out_mv = memoryview(with_crc)
-    out_mv[:n] = mv
-    out_mv[n] = (crc >> 8) & 0xFF
-    out_mv[n + 1] = crc & 0xFF
-
-    # Post process (byte stuffing)
-    stuffed = edmi_post_process(out_mv)
+    if not mv.contiguous:
+        mv = memoryview(mv.tobytes())
 
-    # Append ETX
-    stuffed_mv = stuffed if isinstance(stuffed, memoryview) else memoryview(stuffed)
-    m = len(stuffed_mv)
-    final = bytearray(m + 1)
-    final_mv = memoryview(final)
-    final_mv[:m] = stuffed_mv
-    final_mv[m] = EDMI_ETX_IDEN
+    # Compute CRC over current packet (init=0), appended big-endian
+    crc = binascii.crc_hqx(mv, 0) & 0xFFFF
 
-    return bytes(final_mv)
\ No newline at end of file
+    # Post process (byte stuffing), then append ETX; bytes.join sizes each
+    # result once instead of copying through intermediate bytearrays.
+    stuffed = edmi_post_process(b"".join((mv, _CRC_BE.pack(crc))))
+    return b"".join((stuffed, _ETX_BYTE))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import struct
-from typing import Sequence
+from typing import Callable, Iterable, Sequence
 
 from driver.edmi_enums import (
     EDMI_COMMAND_EXTENSION,
@@ -32,6 +32,42 @@ _I64_BE = struct.Struct(">q")
 _F32_BE = struct.Struct(">f")
 _F64_BE = struct.Struct(">d")
 
+# struct codes for channel types with a fixed-size numeric wire format; they
+# decode exactly as _read_value does.
+_RECORD_CODES: dict[int, str] = {
+    EDMI_TYPE.BYTE: "B",
+    EDMI_TYPE.BOOLEAN: "B",
+    EDMI_TYPE.SHORT: "h",
+    EDMI_TYPE.HEX_SHORT: "H",
+    EDMI_TYPE.LONG: "i",
+    EDMI_TYPE.HEX_LONG: "I",
+    EDMI_TYPE.REGISTER_NUMBER_HEX_LONG: "I",
+    EDMI_TYPE.LONG_LONG: "q",
+    EDMI_TYPE.FLOAT: "f",
+    EDMI_TYPE.POWER_FACTOR: "f",
+    EDMI_TYPE.FLOAT_ENERGY: "i",
+    EDMI_TYPE.DOUBLE: "d",
+    EDMI_TYPE.DOUBLE_ENERGY: "q",
+}
+
+# Fixed-size non-numeric types: struct code plus the expression that turns the
+# unpacked values v{0}, v{1}, ... into what _read_value would return.
+_RECORD_EXPRS: dict[int, tuple[str, str]] = {
+    EDMI_TYPE.DATE: ("3B", "_DT(v{2}, v{1}, v{0}, 0, 0, 0, False)"),
+    EDMI_TYPE.TIME: ("3B", "_DT(0, 0, 0, v{0}, v{1}, v{2}, False)"),
+    EDMI_TYPE.DATE_TIME: ("6B", "_DT(v{2}, v{1}, v{0}, v{3}, v{4}, v{5}, False)"),
+    EDMI_TYPE.ERROR_STRING: ("16s", "v{0}.decode('ascii')"),
+}
+
+RecordParser = tuple[struct.Struct, Callable[[Iterable[tuple]], list[EDMIFileField]]]
+
+# Records with a fixed-size layout are decoded by one precompiled Struct and a
+# parser generated for that exact channel layout, cached per layout.
+_RECORD_PARSERS: dict[tuple[int, ...], RecordParser | None] = {}
+
+# Raw type code -> EDMI_TYPE, or None when unknown, without try/except.
+_TYPE_MAP = EDMI_TYPE._value2member_map_
+
 
 def edmi_create_read_profile_info_access_packet(serial: int, survey: int) -> bytes:
     base = edmi_begin_init_packet(
@@ -441,6 +477,22 @@ def edmi_parse_read_profile_payload(
         return [], EDMI_ERROR_CODE.REQUEST_WRONG_LENGTH
 
     channels_per_record = profile_spec.ChannelsCount
+    if channels_per_record > 0:
+        record_parser = _record_parser(
+            tuple(int(ch.Type) for ch in profile_spec.ChannelsInfo[:channels_per_record])
+        )
+        if record_parser is not None:
+            record_struct, parse_rows = record_parser
+            stride = read.RecordSize if read.RecordSize > 0 else record_struct.size
+            end = idx + stride * read.RecordsCount
+            if stride >= record_struct.size and end <= data_end:
+                if stride == record_struct.size:
+                    rows = record_struct.iter_unpack(mv[idx:end])
+                else:
+                    unpack_from = record_struct.unpack_from
+                    rows = (unpack_from(mv, off) for off in range(idx, end, stride))
+                return parse_rows(rows), EDMI_ERROR_CODE.NONE
+
     fields: list[EDMIFileField] = []
     for record in range(read.RecordsCount):
         record_start = idx
@@ -474,10 +526,60 @@ def edmi_parse_read_profile_payload(
     return fields, EDMI_ERROR_CODE.NONE
 
 
-def _expected_value_len(value_type: int) -> int | None:
+def _record_parser(channel_types: tuple[int, ...]) -> RecordParser | None:
+    """
+    Cached (Struct, parse_rows) for a record layout, or None if not fixed-size.
+
+    parse_rows is generated for the layout so each record is one tuple
+    unpack and one extend with the offsets and conversions written out,
+    instead of a per-field type dispatch.
+    """
     try:
-        vtype = EDMI_TYPE(value_type)
-    except ValueError:
+        return _RECORD_PARSERS[channel_types]
+    except KeyError:
+        pass
+
+    codes: list[str] = []
+    exprs: list[str] = []
+    n_values = 0
+    for t in channel_types:
+        code = _RECORD_CODES.get(t)
+        if code is not None:
+            codes.append(code)
+            exprs.append(f"_F(v{n_values})")
+            n_values += 1
+            continue
+        spec = _RECORD_EXPRS.get(t)
+        if spec is None:
+            _RECORD_PARSERS[channel_types] = None
+            return None
+        code, expr = spec
+        count = int(code[0]) if code.endswith("B") else 1
+        names = [f"v{n_values + k}" for k in range(count)]
+        codes.append(code)
+        exprs.append("_F(" + expr.format(*(name[1:] for name in names)) + ")")
+        n_values += count
+
+    targets = ", ".join(f"v{k}" for k in range(n_values))
+    src = (
+        "def parse_rows(rows):\n"
+        "    fields = []\n"
+        "    extend = fields.extend\n"
+        f"    for {targets}, in rows:\n"
+        f"        extend(({', '.join(exprs)},))\n"
+        "    return fields\n"
+    )
+    namespace = {"_F": EDMIFileField, "_DT": EDMIDateTime}
+    exec(src, namespace)
+
+    record_parser = (struct.Struct(">" + "".join(codes)), namespace["parse_rows"])
+    _RECORD_PARSERS[channel_types] = record_parser
+    return record_parser
+
+
+def _expected_value_len(value_type: int) -> int | None:
+    vtype = _TYPE_MAP.get(value_type)
+    if vtype is None:
         return None
 
     if vtype in (EDMI_TYPE.BYTE, EDMI_TYPE.BOOLEAN):
@@ -568,9 +670,8 @@ def _read_value(
     idx: int,
     value_type: int,
 ) -> tuple[object, int, EDMI_ERROR_CODE]:
-    try:
-        vtype = EDMI_TYPE(value_type)
-    except ValueError:
+    vtype = _TYPE_MAP.get(value_type)
+    if vtype is None:
         return None, idx, EDMI_ERROR_CODE.UNIMPLEMENTED_DATA_TYPE
     if vtype in (EDMI_TYPE.BYTE, EDMI_TYPE.BOOLEAN):
         if idx + 1 > mv.nbytes:
@@ -5,7 +5,7 @@ import logging
 from typing import Union, Sequence, Union, Any, Iterable, List, Callable
 import binascii
 from driver.utils import as_bytes
-from driver.interface.edmi_structs import EDMIRegister
+from driver.interface.edmi_structs import EDMIRegister, RegisterBank
 
 from driver.edmi_enums import (
     EDMI_STX_IDEN,
@@ -219,6 +219,9 @@ _NUMERIC_UNPACKERS: dict[EDMI_TYPE, Callable[[memoryview], object]] = {
 }
 
 
+_STRING_TYPES = frozenset((EDMI_TYPE.STRING, EDMI_TYPE.STRING_LONG, EDMI_TYPE.EFA_STRING))
+
+
 def _parse_value(reg_type: EDMI_TYPE, chunk: memoryview) -> object:
     parser = _SPECIAL_PARSERS.get(reg_type)
     if parser is not None:
@@ -234,8 +237,16 @@ def _parse_value(reg_type: EDMI_TYPE, chunk: memoryview) -> object:
 
 def edmi_parse_read_registers_answer(
     payload: bytes | memoryview,
-    regs: Sequence[EDMIRegister],
+    regs: RegisterBank | Sequence[EDMIRegister],
+    indices: Sequence[int] | None = None,
 ) -> EDMI_ERROR_CODE:
+    """
+    Parse a READ_REGISTER_EXTENDED reply into `regs`.
+
+    `regs` is either a RegisterBank (results written to its ErrorCodes/Values
+    at `indices`, default: every slot in order) or a sequence of EDMIRegister
+    objects, which are updated in place as before.
+    """
     mv = payload if isinstance(payload, memoryview) else memoryview(payload)
 
     if mv.nbytes < 13:
@@ -255,68 +266,123 @@ def edmi_parse_read_registers_answer(
         return EDMI_ERROR_CODE.REQUEST_WRONG_LENGTH
     data_end = mv.nbytes - 3
 
+    if isinstance(regs, RegisterBank):
+        return _parse_into_bank(
+            mv, data_end, regs, range(len(regs)) if indices is None else indices
+        )
+    if indices is not None:
+        regs = [regs[i] for i in indices]
+    return _parse_into_registers(mv, data_end, regs)
+
+
+def _decode_value(
+    mv: memoryview,
+    idx: int,
+    data_end: int,
+    reg_type: int,
+    value_len: int,
+    name: str,
+) -> tuple[object, int]:
+    """
+    Decode one register value that the meter answered without error.
+    Returns (value, index past it), or (None, -1) if the reply is short.
+    """
+    if reg_type in _STRING_TYPES:
+        logger.warning(name)
+        if idx >= data_end:
+            logger.warning("REQUEST_WRONG_LENGTH#3")
+            return None, -1
+        scan_len = min(value_len, data_end - idx)
+        chunk = mv[idx : idx + scan_len].tobytes()
+        nul = chunk.find(b"\x00")
+        if nul >= 0:
+            return chunk[:nul].decode("ascii", "strict"), idx + nul + 1
+        if scan_len < value_len:
+            logger.warning("REQUEST_WRONG_LENGTH#3")
+            return None, -1
+        return chunk.decode("ascii", "strict"), idx + value_len
+
+    end = idx + value_len
+    if end > data_end:
+        logger.warning("REQUEST_WRONG_LENGTH#5")
+        return None, -1
+    return _parse_value(reg_type, mv[idx:end]), end
+
+
+def _log_short_error(error_code, address, name, idx, value_len, data_end) -> None:
+    logger.warning(
+        "REQUEST_WRONG_LENGTH#6 err=%s addr=%s name=%s idx=%s value_len=%s data_end=%s",
+        error_code,
+        address,
+        name,
+        idx,
+        value_len,
+        data_end,
+    )
+
+
+def _parse_into_registers(
+    mv: memoryview,
+    data_end: int,
+    regs: Iterable[EDMIRegister],
+) -> EDMI_ERROR_CODE:
     idx = 17
 
     for reg in regs:
-        reg.ErrorCode = mv[idx]
+        error_code = mv[idx]
+        reg.ErrorCode = error_code
         idx += 1
 
-        value_len = reg.ValueLen
-        end = idx
-        if reg.ErrorCode == EDMI_ERROR_CODE.NONE:
-            if reg.Type in (EDMI_TYPE.STRING, EDMI_TYPE.STRING_LONG, EDMI_TYPE.EFA_STRING):
-                logger.warning(reg.Name)
-                if idx >= data_end:
-                    logger.warning("REQUEST_WRONG_LENGTH#3")
-                    return EDMI_ERROR_CODE.REQUEST_WRONG_LENGTH
-                scan_len = min(value_len, data_end - idx)
-                chunk = mv[idx : idx + scan_len].tobytes()
-                nul = chunk.find(b"\x00")
-                if nul >= 0:
-                    reg.Value = chunk[:nul].decode("ascii", "strict")
-                    idx += nul + 1
-                elif scan_len < value_len:
-                    logger.warning("REQUEST_WRONG_LENGTH#3")
-                    return EDMI_ERROR_CODE.REQUEST_WRONG_LENGTH
-                else:
-                    reg.Value = chunk.decode("ascii", "strict")
-                    idx += value_len
-                end = idx
-            else:
-                if idx + value_len > data_end:
-                    logger.warning("REQUEST_WRONG_LENGTH#5")
-                    return EDMI_ERROR_CODE.REQUEST_WRONG_LENGTH
-                end = idx + value_len
-                reg.Value = _parse_value(reg.Type, mv[idx:end])
-                idx = end
-        elif reg.ErrorCode == EDMI_ERROR_CODE.REGISTER_NOT_FOUND:
+        if error_code == EDMI_ERROR_CODE.NONE:
+            value, idx = _decode_value(mv, idx, data_end, reg.Type, reg.ValueLen, reg.Name)
+            if idx < 0:
+                return EDMI_ERROR_CODE.REQUEST_WRONG_LENGTH
+            reg.Value = value
+        elif error_code == EDMI_ERROR_CODE.REGISTER_NOT_FOUND:
             reg.Value = None
-            end = idx
             logger.warning("Register not found: %s", reg.Name)
         else:
             reg.Value = None
-            if idx + value_len > data_end:
-                logger.warning(
-                    "REQUEST_WRONG_LENGTH#6 err=%s addr=%s name=%s idx=%s value_len=%s data_end=%s",
-                    int(reg.ErrorCode),
-                    int(reg.Address),
-                    reg.Name,
-                    idx,
-                    value_len,
-                    data_end,
-                )
+            if idx + reg.ValueLen > data_end:
+                _log_short_error(error_code, int(reg.Address), reg.Name, idx, reg.ValueLen, data_end)
+                # Some meters omit data bytes when an error is returned for a register.
+                return EDMI_ERROR_CODE(error_code)
+
+    return EDMI_ERROR_CODE.NONE
+
+
+def _parse_into_bank(
+    mv: memoryview,
+    data_end: int,
+    bank: RegisterBank,
+    indices: Iterable[int],
+) -> EDMI_ERROR_CODE:
+    types = bank.Types
+    value_lens = bank.ValueLens
+    names = bank.Names
+    errors = bank.ErrorCodes
+    values = bank.Values
+
+    idx = 17
+
+    for i in indices:
+        error_code = mv[idx]
+        errors[i] = error_code
+        idx += 1
+
+        if error_code == EDMI_ERROR_CODE.NONE:
+            value, idx = _decode_value(mv, idx, data_end, types[i], value_lens[i], names[i])
+            if idx < 0:
+                return EDMI_ERROR_CODE.REQUEST_WRONG_LENGTH
+            values[i] = value
+        elif error_code == EDMI_ERROR_CODE.REGISTER_NOT_FOUND:
+            values[i] = None
+            logger.warning("Register not found: %s", names[i])
+        else:
+            values[i] = None
+            if idx + value_lens[i] > data_end:
+                _log_short_error(error_code, int(bank.Addresses[i]), names[i], idx, value_lens[i], data_end)
                 # Some meters omit data bytes when an error is returned for a register.
-                return EDMI_ERROR_CODE(int(reg.ErrorCode))
-            end = idx
-        idx = end
-
-        # logger.info(
-        #     "REG name=%s addr=0x%04X value=%s err=0x%02X len=%s",
-        #     reg.Name,
-        #     int(reg.Address),
-        #     reg.Value,
-        #     int(reg.ErrorCode),
-        #     int(reg.ValueLen),
-        # )
+                return EDMI_ERROR_CODE(error_code)
 
     return EDMI_ERROR_CODE.NONE
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import ClassVar, List
+from typing import ClassVar, Iterable, Iterator, List
 import struct
 from driver.edmi_enums import EDMI_TYPE, EDMI_UNIT_CODE, EDMI_REGISTER, EDMI_TYPE
 
@@ -33,6 +33,118 @@ class EDMIRegister:
     ValueLen: int
 
 
+@dataclass
+class RegisterBank:
+    """
+    Struct-of-arrays register set.
+
+    Descriptors (name, address, type, length) are immutable and can be shared
+    between banks; only UnitCodes/ErrorCodes/Values are written by a read.
+    ErrorCodes and Values stay lists: values are heterogeneous (float, int,
+    str, tuples) and None marks "not read yet".
+    """
+    Names: tuple[str, ...]
+    Addresses: tuple[int, ...]
+    Types: bytes
+    ValueLens: bytes
+    UnitCodes: list
+    ErrorCodes: list
+    Values: list
+
+    @classmethod
+    def from_registers(cls, regs: Iterable[EDMIRegister]) -> "RegisterBank":
+        regs = tuple(regs)
+        return cls(
+            Names=tuple(r.Name for r in regs),
+            Addresses=tuple(r.Address for r in regs),
+            Types=bytes(r.Type for r in regs),
+            ValueLens=bytes(r.ValueLen for r in regs),
+            UnitCodes=[r.UnitCode for r in regs],
+            ErrorCodes=[r.ErrorCode for r in regs],
+            Values=[r.Value for r in regs],
+        )
+
+    @classmethod
+    def from_specs(
+        cls, specs: Iterable[tuple[str, int, int, int]]
+    ) -> "RegisterBank":
+        """Build an unread bank straight from (Name, Address, Type, ValueLen)."""
+        specs = tuple(specs)
+        count = len(specs)
+        return cls(
+            Names=tuple(s[0] for s in specs),
+            Addresses=tuple(s[1] for s in specs),
+            Types=bytes(s[2] for s in specs),
+            ValueLens=bytes(s[3] for s in specs),
+            UnitCodes=[None] * count,
+            ErrorCodes=[None] * count,
+            Values=[None] * count,
+        )
+
+    def copy(self) -> "RegisterBank":
+        """New bank sharing the descriptors, with its own mutable state."""
+        return RegisterBank(
+            Names=self.Names,
+            Addresses=self.Addresses,
+            Types=self.Types,
+            ValueLens=self.ValueLens,
+            UnitCodes=list(self.UnitCodes),
+            ErrorCodes=list(self.ErrorCodes),
+            Values=list(self.Values),
+        )
+
+    def __len__(self) -> int:
+        return len(self.Addresses)
+
+    def __getitem__(self, i: int) -> "RegisterView":
+        return RegisterView(self, i)
+
+    def __iter__(self) -> Iterator["RegisterView"]:
+        for i in range(len(self.Addresses)):
+            yield self[i]
+
+
+
+def _slot(column: str) -> property:
+    def get(self):
+        return getattr(self._bank, column)[self._i]
+
+    def set(self, value):
+        getattr(self._bank, column)[self._i] = value
+
+    return property(get, set)
+
+
+class RegisterView:
+    """
+    One RegisterBank slot with the EDMIRegister attribute names.
+
+    UnitCode/ErrorCode/Value read and write the bank itself, so
+    `meter.regs[i].Value = x` is seen by the next reader of the bank.
+    """
+    __slots__ = ("_bank", "_i")
+
+    def __init__(self, bank: RegisterBank, i: int) -> None:
+        self._bank = bank
+        self._i = i
+
+    Name = property(lambda self: self._bank.Names[self._i])
+    Address = property(lambda self: self._bank.Addresses[self._i])
+    Type = property(lambda self: EDMI_TYPE(self._bank.Types[self._i]))
+    ValueLen = property(lambda self: self._bank.ValueLens[self._i])
+    UnitCode = _slot("UnitCodes")
+    ErrorCode = _slot("ErrorCodes")
+    Value = _slot("Values")
+
+    def __repr__(self) -> str:
+        return (
+            f"RegisterView(Name={self.Name!r}, Address={self.Address!r}, "
+            f"Type={self.Type!r}, UnitCode={self.UnitCode!r}, "
+            f"ErrorCode={self.ErrorCode!r}, Value={self.Value!r}, "
+            f"ValueLen={self.ValueLen!r})"
+        )
+
+
 class EDMISurvey(IntEnum):
     LS01 = 0x0305
     LS02 = 0x0325
@@ -100,6 +212,9 @@ class EDMIReadFile:
 
 @dataclass
 class EDMIFileField:
+    # One instance per channel per record; slots drop the per-instance __dict__.
+    __slots__ = ("Value",)
+
     Value: str
 
     ValueLen: ClassVar[int] = MAX_VALUE_LENGTH
@@ -119,6 +234,112 @@ class EDMIProfileSpec:
     ValueLen: ClassVar[int] = MAX_VALUE_LENGTH
     MAX_CHANNELS: ClassVar[int] = EDMI_MAX_CHANNELS_COUNT
 
+### Register table
+# (Name, Address, Type, ValueLen) for every register a Meter reads, in read
+# order. The factory methods below and Meter.init_all_registers build from it.
+ALL_REGISTER_SPECS: tuple[tuple[str, int, int, int], ...] = (
+    # Multipliers / Divisors
+    ("Current Multiplier Register", EDMI_REGISTER.CURRENT_MULTIPLIER, EDMI_TYPE.FLOAT, 4),
+    ("Voltage Multiplier Register", EDMI_REGISTER.VOLTAGE_MULTIPLIER, EDMI_TYPE.FLOAT, 4),
+    ("Current Divisor Register", EDMI_REGISTER.CURRENT_DIVISOR, EDMI_TYPE.FLOAT, 4),
+    ("Voltage Divisor Register", EDMI_REGISTER.VOLTAGE_DIVISOR, EDMI_TYPE.FLOAT, 4),
+
+    # Voltages
+    ("Phase A Voltage Register", EDMI_REGISTER.PHASE_A_VOLTAGE, EDMI_TYPE.FLOAT, 4),
+    ("Phase B Voltage Register", EDMI_REGISTER.PHASE_B_VOLTAGE, EDMI_TYPE.FLOAT, 4),
+    ("Phase C Voltage Register", EDMI_REGISTER.PHASE_C_VOLTAGE, EDMI_TYPE.FLOAT, 4),
+
+    # Currents
+    ("Phase A Current Register", EDMI_REGISTER.PHASE_A_CURRENT, EDMI_TYPE.FLOAT, 4),
+    ("Phase B Current Register", EDMI_REGISTER.PHASE_B_CURRENT, EDMI_TYPE.FLOAT, 4),
+    ("Phase C Current Register", EDMI_REGISTER.PHASE_C_CURRENT, EDMI_TYPE.FLOAT, 4),
+
+    # Angles
+    ("Phase A Angle Register", EDMI_REGISTER.PHASE_A_ANGLE, EDMI_TYPE.FLOAT, 4),
+    ("Phase B Angle Register", EDMI_REGISTER.PHASE_B_ANGLE, EDMI_TYPE.FLOAT, 4),
+    ("Phase C Angle Register", EDMI_REGISTER.PHASE_C_ANGLE, EDMI_TYPE.FLOAT, 4),
+    ("VTA-VTB Angle Register", EDMI_REGISTER.VTA_VTB_ANGLE, EDMI_TYPE.FLOAT, 4),
+    ("VTA-VTC Angle Register", EDMI_REGISTER.VTA_VTC_ANGLE, EDMI_TYPE.FLOAT, 4),
+
+    # Watts
+    ("Phase A Watts Register", EDMI_REGISTER.PHASE_A_WATTS, EDMI_TYPE.FLOAT, 4),
+    ("Phase B Watts Register", EDMI_REGISTER.PHASE_B_WATTS, EDMI_TYPE.FLOAT, 4),
+    ("Phase C Watts Register", EDMI_REGISTER.PHASE_C_WATTS, EDMI_TYPE.FLOAT, 4),
+
+    # Vars
+    ("Phase A Vars Register", EDMI_REGISTER.PHASE_A_VARS, EDMI_TYPE.FLOAT, 4),
+    ("Phase B Vars Register", EDMI_REGISTER.PHASE_B_VARS, EDMI_TYPE.FLOAT, 4),
+    ("Phase C Vars Register", EDMI_REGISTER.PHASE_C_VARS, EDMI_TYPE.FLOAT, 4),
+
+    # VA
+    ("Phase A VA Register", EDMI_REGISTER.PHASE_A_VA, EDMI_TYPE.FLOAT, 4),
+    ("Phase B VA Register", EDMI_REGISTER.PHASE_B_VA, EDMI_TYPE.FLOAT, 4),
+    ("Phase C VA Register", EDMI_REGISTER.PHASE_C_VA, EDMI_TYPE.FLOAT, 4),
+
+    # Power / Frequency
+    ("Power Factor Register", EDMI_REGISTER.POWER_FACTOR, EDMI_TYPE.FLOAT, 4),
+    ("Frequency Register", EDMI_REGISTER.FREQUENCY, EDMI_TYPE.FLOAT, 4),
+
+    # Energy Import (double)
+    ("Rate 1 Import kWh Register", EDMI_REGISTER.RATE_1_IMPORT_KWH, EDMI_TYPE.DOUBLE, 8),
+    ("Rate 2 Import kWh Register", EDMI_REGISTER.RATE_2_IMPORT_KWH, EDMI_TYPE.DOUBLE, 8),
+    ("Rate 3 Import kWh Register", EDMI_REGISTER.RATE_3_IMPORT_KWH, EDMI_TYPE.DOUBLE, 8),
+    ("Total Import kWh Register", EDMI_REGISTER.TOTAL_IMPORT_KWH, EDMI_TYPE.DOUBLE, 8),
+    ("Total Import kVar Register", EDMI_REGISTER.TOTAL_IMPORT_KVAR, EDMI_TYPE.DOUBLE, 8),
+
+    # Energy Export (double)
+    ("Rate 1 Export kWh Register", EDMI_REGISTER.RATE_1_EXPORT_KWH, EDMI_TYPE.DOUBLE, 8),
+    ("Rate 2 Export kWh Register", EDMI_REGISTER.RATE_2_EXPORT_KWH, EDMI_TYPE.DOUBLE, 8),
+    ("Rate 3 Export kWh Register", EDMI_REGISTER.RATE_3_EXPORT_KWH, EDMI_TYPE.DOUBLE, 8),
+    ("Total Export kWh Register", EDMI_REGISTER.TOTAL_EXPORT_KWH, EDMI_TYPE.DOUBLE, 8),
+    ("Total Export kVar Register", EDMI_REGISTER.TOTAL_EXPORT_KVAR, EDMI_TYPE.DOUBLE, 8),
+
+    # THD
+    ("THD Voltage A Register", EDMI_REGISTER.THD_VOLTAGE_A, EDMI_TYPE.FLOAT, 4),
+    ("THD Voltage B Register", EDMI_REGISTER.THD_VOLTAGE_B, EDMI_TYPE.FLOAT, 4),
+    ("THD Voltage C Register", EDMI_REGISTER.THD_VOLTAGE_C, EDMI_TYPE.FLOAT, 4),
+    ("THD Current A Register", EDMI_REGISTER.THD_CURRENT_A, EDMI_TYPE.FLOAT, 4),
+    ("THD Current B Register", EDMI_REGISTER.THD_CURRENT_B, EDMI_TYPE.FLOAT, 4),
+    ("THD Current C Register", EDMI_REGISTER.THD_CURRENT_C, EDMI_TYPE.FLOAT, 4),
+
+    # Totals
+    ("P Total Register", EDMI_REGISTER.P_TOTAL, EDMI_TYPE.FLOAT, 4),
+    ("Q Total Register", EDMI_REGISTER.Q_TOTAL, EDMI_TYPE.FLOAT, 4),
+    ("S Total Register", EDMI_REGISTER.S_TOTAL, EDMI_TYPE.FLOAT, 4),
+
+    # Ratios
+    ("CT Ratio Primary Register", EDMI_REGISTER.CT_RATIO_PRIMARY, EDMI_TYPE.FLOAT, 4),
+    ("CT Ratio Secondary Register", EDMI_REGISTER.CT_RATIO_SECONDARY, EDMI_TYPE.FLOAT, 4),
+    ("VT Ratio Primary Register", EDMI_REGISTER.VT_RATIO_PRIMARY, EDMI_TYPE.FLOAT, 4),
+    ("VT Ratio Secondary Register", EDMI_REGISTER.VT_RATIO_SECONDARY, EDMI_TYPE.FLOAT, 4),
+
+    # Demand
+    ("Max Demand kWh Import Register", EDMI_REGISTER.MAX_DEMAND_KWH_IMPORT, EDMI_TYPE.DOUBLE, 8),
+    ("Max Demand kWh Export Register", EDMI_REGISTER.MAX_DEMAND_KWH_EXPORT, EDMI_TYPE.DOUBLE, 8),
+
+    # Meter Information
+    ("Meter Serial Number Register", EDMI_REGISTER.METER_SERIAL_NUMBER, EDMI_TYPE.SERIAL_NUMBER, 10),
+    # Diagnostics
+    ("Error Code Register", EDMI_REGISTER.ERROR_CODE, EDMI_TYPE.ERROR_STRING, 17),
+    ("Current Date Register", EDMI_REGISTER.CURRENT_DATE, EDMI_TYPE.DATE, 3),
+    ("Current Time Register", EDMI_REGISTER.CURRENT_TIME, EDMI_TYPE.TIME, 3),
+    ("Date Time Register", EDMI_REGISTER.DATE_TIME, EDMI_TYPE.DATE_TIME, 6),
+)
+_REGISTER_SPEC_BY_NAME = {spec[0]: spec for spec in ALL_REGISTER_SPECS}
+
+
+def _make_register(name: str) -> EDMIRegister:
+    name, address, reg_type, value_len = _REGISTER_SPEC_BY_NAME[name]
+    return EDMIRegister(
+        Name=name,
+        Address=address,
+        Type=reg_type,
+        UnitCode=None,
+        ErrorCode=None,
+        Value=None,
+        ValueLen=value_len,
+    )
+
 ### Register Object Factory
 from dataclasses import dataclass
 
@@ -127,647 +348,199 @@ class EDMIRegisterFactory:
     ###################################################
     # ########## Multipliers / Divisors ################
     def CreateCurrentMultiplierRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Current Multiplier Register",
-            Address=EDMI_REGISTER.CURRENT_MULTIPLIER,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Current Multiplier Register")
 
     def CreateVoltageMultiplierRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Voltage Multiplier Register",
-            Address=EDMI_REGISTER.VOLTAGE_MULTIPLIER,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Voltage Multiplier Register")
 
     def CreateCurrentDivisorRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Current Divisor Register",
-            Address=EDMI_REGISTER.CURRENT_DIVISOR,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Current Divisor Register")
 
     def CreateVoltageDivisorRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Voltage Divisor Register",
-            Address=EDMI_REGISTER.VOLTAGE_DIVISOR,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Voltage Divisor Register")
 
     #########################################
     ##########  3 Phase Voltages ############
     def CreatePhaseAVoltageRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase A Voltage Register",
-            Address=EDMI_REGISTER.PHASE_A_VOLTAGE,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase A Voltage Register")
 
     def CreatePhaseBVoltageRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase B Voltage Register",
-            Address=EDMI_REGISTER.PHASE_B_VOLTAGE,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase B Voltage Register")
 
     def CreatePhaseCVoltageRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase C Voltage Register",
-            Address=EDMI_REGISTER.PHASE_C_VOLTAGE,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase C Voltage Register")
 
     #########################################
     ##########  3 Phase Currents ############
     def CreatePhaseACurrentRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase A Current Register",
-            Address=EDMI_REGISTER.PHASE_A_CURRENT,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase A Current Register")
 
     def CreatePhaseBCurrentRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase B Current Register",
-            Address=EDMI_REGISTER.PHASE_B_CURRENT,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase B Current Register")
 
     def CreatePhaseCCurrentRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase C Current Register",
-            Address=EDMI_REGISTER.PHASE_C_CURRENT,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase C Current Register")
 
     #########################################
     ##########  3 Phase Angles ############
     def CreatePhaseAAngleRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase A Angle Register",
-            Address=EDMI_REGISTER.PHASE_A_ANGLE,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase A Angle Register")
 
     def CreatePhaseBAngleRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase B Angle Register",
-            Address=EDMI_REGISTER.PHASE_B_ANGLE,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase B Angle Register")
 
     def CreatePhaseCAngleRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase C Angle Register",
-            Address=EDMI_REGISTER.PHASE_C_ANGLE,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase C Angle Register")
 
     def CreateVtaVtbAngleRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="VTA-VTB Angle Register",
-            Address=EDMI_REGISTER.VTA_VTB_ANGLE,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("VTA-VTB Angle Register")
 
     def CreateVtaVtcAngleRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="VTA-VTC Angle Register",
-            Address=EDMI_REGISTER.VTA_VTC_ANGLE,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("VTA-VTC Angle Register")
 
     #########################################
     ##########  3 Phase Watts ############
     def CreatePhaseAWattsRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase A Watts Register",
-            Address=EDMI_REGISTER.PHASE_A_WATTS,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase A Watts Register")
 
     def CreatePhaseBWattsRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase B Watts Register",
-            Address=EDMI_REGISTER.PHASE_B_WATTS,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase B Watts Register")
 
     def CreatePhaseCWattsRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase C Watts Register",
-            Address=EDMI_REGISTER.PHASE_C_WATTS,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase C Watts Register")
 
     #########################################
     ##########  3 Phase Vars ############
     def CreatePhaseAVarsRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase A Vars Register",
-            Address=EDMI_REGISTER.PHASE_A_VARS,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase A Vars Register")
 
     def CreatePhaseBVarsRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase B Vars Register",
-            Address=EDMI_REGISTER.PHASE_B_VARS,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase B Vars Register")
 
     def CreatePhaseCVarsRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase C Vars Register",
-            Address=EDMI_REGISTER.PHASE_C_VARS,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase C Vars Register")
 
     #########################################
     ##########  3 Phase VA ############
     def CreatePhaseAVaRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase A VA Register",
-            Address=EDMI_REGISTER.PHASE_A_VA,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase A VA Register")
 
     def CreatePhaseBVaRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase B VA Register",
-            Address=EDMI_REGISTER.PHASE_B_VA,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase B VA Register")
 
     def CreatePhaseCVaRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Phase C VA Register",
-            Address=EDMI_REGISTER.PHASE_C_VA,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Phase C VA Register")
 
     #############################################
     ############# Power / Frequency #############
     def CreatePowerFactorRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Power Factor Register",
-            Address=EDMI_REGISTER.POWER_FACTOR,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Power Factor Register")
 
     def CreateFrequencyRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Frequency Register",
-            Address=EDMI_REGISTER.FREQUENCY,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Frequency Register")
 
     ##################################################
     ############### Energy Import (double)#############
     def CreateRate1ImportKwhRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Rate 1 Import kWh Register",
-            Address=EDMI_REGISTER.RATE_1_IMPORT_KWH,
-            Type=EDMI_TYPE.DOUBLE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=8
-        )
+        return _make_register("Rate 1 Import kWh Register")
 
     def CreateRate2ImportKwhRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Rate 2 Import kWh Register",
-            Address=EDMI_REGISTER.RATE_2_IMPORT_KWH,
-            Type=EDMI_TYPE.DOUBLE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=8
-        )
+        return _make_register("Rate 2 Import kWh Register")
 
     def CreateRate3ImportKwhRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Rate 3 Import kWh Register",
-            Address=EDMI_REGISTER.RATE_3_IMPORT_KWH,
-            Type=EDMI_TYPE.DOUBLE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=8
-        )
+        return _make_register("Rate 3 Import kWh Register")
 
     def CreateTotalImportKwhRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Total Import kWh Register",
-            Address=EDMI_REGISTER.TOTAL_IMPORT_KWH,
-            Type=EDMI_TYPE.DOUBLE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=8
-        )
+        return _make_register("Total Import kWh Register")
 
     def CreateTotalImportKvarRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Total Import kVar Register",
-            Address=EDMI_REGISTER.TOTAL_IMPORT_KVAR,
-            Type=EDMI_TYPE.DOUBLE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=8
-        )
+        return _make_register("Total Import kVar Register")
 
     ##################################################
     ############### Energy Export (double)#############
     def CreateRate1ExportKwhRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Rate 1 Export kWh Register",
-            Address=EDMI_REGISTER.RATE_1_EXPORT_KWH,
-            Type=EDMI_TYPE.DOUBLE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=8
-        )
+        return _make_register("Rate 1 Export kWh Register")
 
     def CreateRate2ExportKwhRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Rate 2 Export kWh Register",
-            Address=EDMI_REGISTER.RATE_2_EXPORT_KWH,
-            Type=EDMI_TYPE.DOUBLE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=8
-        )
+        return _make_register("Rate 2 Export kWh Register")
 
     def CreateRate3ExportKwhRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Rate 3 Export kWh Register",
-            Address=EDMI_REGISTER.RATE_3_EXPORT_KWH,
-            Type=EDMI_TYPE.DOUBLE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=8
-        )
+        return _make_register("Rate 3 Export kWh Register")
 
     def CreateTotalExportKwhRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Total Export kWh Register",
-            Address=EDMI_REGISTER.TOTAL_EXPORT_KWH,
-            Type=EDMI_TYPE.DOUBLE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=8
-        )
+        return _make_register("Total Export kWh Register")
 
     def CreateTotalExportKvarRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Total Export kVar Register",
-            Address=EDMI_REGISTER.TOTAL_EXPORT_KVAR,
-            Type=EDMI_TYPE.DOUBLE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=8
-        )
+        return _make_register("Total Export kVar Register")
 
     ##################################################
     #################### THD ##########################
     def CreateThdVoltageARegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="THD Voltage A Register",
-            Address=EDMI_REGISTER.THD_VOLTAGE_A,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("THD Voltage A Register")
 
     def CreateThdVoltageBRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="THD Voltage B Register",
-            Address=EDMI_REGISTER.THD_VOLTAGE_B,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("THD Voltage B Register")
 
     def CreateThdVoltageCRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="THD Voltage C Register",
-            Address=EDMI_REGISTER.THD_VOLTAGE_C,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("THD Voltage C Register")
 
     def CreateThdCurrentARegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="THD Current A Register",
-            Address=EDMI_REGISTER.THD_CURRENT_A,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("THD Current A Register")
 
     def CreateThdCurrentBRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="THD Current B Register",
-            Address=EDMI_REGISTER.THD_CURRENT_B,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("THD Current B Register")
 
     def CreateThdCurrentCRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="THD Current C Register",
-            Address=EDMI_REGISTER.THD_CURRENT_C,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("THD Current C Register")
 
     ##################################################
     #################### Totals #######################
     def CreatePTotalRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="P Total Register",
-            Address=EDMI_REGISTER.P_TOTAL,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("P Total Register")
 
     def CreateQTotalRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Q Total Register",
-            Address=EDMI_REGISTER.Q_TOTAL,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("Q Total Register")
 
     def CreateSTotalRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="S Total Register",
-            Address=EDMI_REGISTER.S_TOTAL,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("S Total Register")
 
     ##################################################
     #################### Ratios #######################
     def CreateCtRatioPrimaryRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="CT Ratio Primary Register",
-            Address=EDMI_REGISTER.CT_RATIO_PRIMARY,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("CT Ratio Primary Register")
 
     def CreateCtRatioSecondaryRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="CT Ratio Secondary Register",
-            Address=EDMI_REGISTER.CT_RATIO_SECONDARY,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("CT Ratio Secondary Register")
 
     def CreateVtRatioPrimaryRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="VT Ratio Primary Register",
-            Address=EDMI_REGISTER.VT_RATIO_PRIMARY,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("VT Ratio Primary Register")
 
     def CreateVtRatioSecondaryRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="VT Ratio Secondary Register",
-            Address=EDMI_REGISTER.VT_RATIO_SECONDARY,
-            Type=EDMI_TYPE.FLOAT,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=4
-        )
+        return _make_register("VT Ratio Secondary Register")
 
     ##################################################
     ################## Diagnostics ####################
     def CreateErrorCodeRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Error Code Register",
-            Address=EDMI_REGISTER.ERROR_CODE,
-            Type=EDMI_TYPE.ERROR_STRING,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=17
-        )
+        return _make_register("Error Code Register")
 
     ##################################################
     #################### Demand #######################
     def CreateMaxDemandKwhImportRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Max Demand kWh Import Register",
-            Address=EDMI_REGISTER.MAX_DEMAND_KWH_IMPORT,
-            Type=EDMI_TYPE.DOUBLE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=8
-        )
+        return _make_register("Max Demand kWh Import Register")
 
     def CreateMaxDemandKwhExportRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Max Demand kWh Export Register",
-            Address=EDMI_REGISTER.MAX_DEMAND_KWH_EXPORT,
-            Type=EDMI_TYPE.DOUBLE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=8
-        )
+        return _make_register("Max Demand kWh Export Register")
 
     ##################################################
     ################ Meter Information ################
     def CreateMeterSerialNumberRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Meter Serial Number Register",
-            Address=EDMI_REGISTER.METER_SERIAL_NUMBER,
-            Type=EDMI_TYPE.SERIAL_NUMBER,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=10
-        )
+        return _make_register("Meter Serial Number Register")
 
     def CreateCurrentDateRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Current Date Register",
-            Address=EDMI_REGISTER.CURRENT_DATE,
-            Type=EDMI_TYPE.DATE,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=3
-        )
+        return _make_register("Current Date Register")
 
     def CreateCurrentTimeRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Current Time Register",
-            Address=EDMI_REGISTER.CURRENT_TIME,
-            Type=EDMI_TYPE.TIME,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=3
-        )
+        return _make_register("Current Time Register")
 
     def CreateDateTimeRegister() -> EDMIRegister:
-        return EDMIRegister(
-            Name="Date Time Register",
-            Address=EDMI_REGISTER.DATE_TIME,
-            Type=EDMI_TYPE.DATE_TIME,
-            UnitCode=None,
-            ErrorCode=None,
-            Value=None,
-            ValueLen=6
-        )
+        return _make_register("Date Time Register")
@@ -9,12 +9,7 @@ from datetime import datetime
 from typing import Any, Iterable, Tuple
 
 from driver.edmi_enums import EDMI_ERROR_CODE
-from driver.frames_codec.generics import (
-
-    edmi_pre_process,
-    edmi_validate_crc,
-    wake_up_seq,
-)
+from driver.frames_codec.generics import wake_up_seq
 from driver.frames_codec.edmi_profile_frame import edmi_coerce_datetime
 from driver.frames_codec.login_frame import edmi_create_login_packet, edmi_parse_login_answer
 from driver.frames_codec.read_profile_frame import (
@@ -29,10 +24,7 @@ from driver.frames_codec.read_profile_frame import (
     edmi_set_file_channel_info,
     edmi_set_profile_info,
 )
-from driver.frames_codec.read_registers_frame import (
-    edmi_create_read_registers_packet,
-    edmi_parse_read_registers_answer,
-)
+from driver.frames_codec.read_registers_frame import edmi_parse_read_registers_answer
 from driver.interface.edmi_structs import (
     EDMIDateTime,
     EDMIFileChannelInfo,
@@ -43,23 +35,40 @@ from driver.interface.edmi_structs import (
     EDMISearchFile,
     EDMISearchFileDir,
     EDMISurvey,
+    RegisterBank,
 )
+from driver.interface.session import CrcError, read_regs_packet, txrx
 from driver.transport.serial_transport import SerialNotReadyError, SerialTransport
-from driver.utils import bytes_to_hex, combine_packets
+from driver.utils import combine_packets
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 log.propagate = True
 
+# Adaptive profile chunk sizing: after this many full-size replies in a row,
+# one read asks for _PROFILE_PROBE_STEP more records (up to the survey
+# default). If the meter returns fewer, the limit becomes what it returned
+# (raised if that is above the old limit, lowered if below, as outside a
+# probe); when it was not lowered, probing pauses for _PROFILE_PROBE_BACKOFF
+# full-size replies.
+_PROFILE_PROBE_INTERVAL = 4
+_PROFILE_PROBE_STEP = 8
+_PROFILE_PROBE_BACKOFF = 16
+
 
 class Media:
     """
     Synchronous Media API.
 
     Threading:
-      - Media is protected with threading.Lock to preserve existing behavior.
+      - Multi-frame operations (login, register and profile reads) are
+        protected with threading.Lock to preserve existing behavior.
+      - Each request/reply exchange holds the transport's exchange_lock;
+        flush_input only takes that lock, not the Media lock.
       - Serial single-in-flight is also protected inside SerialTransport.
+      - The lock is per Media instance, so Media objects bound to different
+        transports never block each other.
     """
 
     def __init__(self, serial_transport: SerialTransport, debug: bool = True) -> None:
@@ -68,6 +77,7 @@ class Media:
         self.debug = debug
         self._is_connected = False  # retained for interface compatibility
         self._profile_read_limit_cache: dict[tuple[int, int], int] = {}
+        self._profile_probe_counter: dict[tuple[int, int, int], int] = {}
 
         self.username: str = ""
         self.password: str = ""
@@ -92,6 +102,9 @@ class Media:
         self.password = password
         self.serial_number = serial_number
 
+    def _txrx(self, packet: bytes) -> memoryview:
+        return txrx(self.transport, packet, debug=self.debug)
+
     # ----------------------------
     # Public API
     # ----------------------------
@@ -121,23 +134,14 @@ class Media:
                 except SerialNotReadyError:
                     return EDMI_ERROR_CODE.GET_METER_ATTENTION_FAILED
 
-                self.transport.write_packet(wlogin_packet)
-                if self.debug:
-                    log.info("TX <- %s", bytes_to_hex(wlogin_packet))
-
-                received = self.transport.read_edmi_packet()
-                payload = edmi_pre_process(received)
-                if self.debug:
-                    log.info("RX <- %s", bytes_to_hex(payload))
-
-                ret = edmi_validate_crc(payload)
-                if ret != EDMI_ERROR_CODE.NONE:
-                    return ret
+                payload = self._txrx(wlogin_packet)
 
                 return edmi_parse_login_answer(payload)
 
             except SerialNotReadyError:
                 return EDMI_ERROR_CODE.GET_METER_ATTENTION_FAILED
+            except CrcError as exc:
+                return exc.code
             except Exception:
                 log.error("Login operation failed", exc_info=True)
                 self._safe_disconnect()
@@ -166,45 +170,24 @@ class Media:
         )
         wlogin_packet = combine_packets(wake_up, login_packet)
 
-        read_regs_packet = edmi_create_read_registers_packet(
-            serial=serial_number,
-            regs=[int(reg.Address) for reg in regs],
-        )
+        if isinstance(regs, RegisterBank):
+            addresses = regs.Addresses
+        else:
+            addresses = tuple(int(reg.Address) for reg in regs)
+        regs_packet = read_regs_packet(serial_number, addresses)
 
         with self._lock:
             try:
                 self._ensure_connected()
 
                 if do_login:
-                    self.transport.write_packet(wlogin_packet)
-                    if self.debug:
-                        log.info("TX <- %s", bytes_to_hex(wlogin_packet))
-
-                    received = self.transport.read_edmi_packet()
-                    payload = edmi_pre_process(received)
-                    if self.debug:
-                        log.info("RX <- %s", bytes_to_hex(payload))
-
-                    ret = edmi_validate_crc(payload)
-                    if ret != EDMI_ERROR_CODE.NONE:
-                        raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
+                    payload = self._txrx(wlogin_packet)
 
                     ret = edmi_parse_login_answer(payload)
                     if ret != EDMI_ERROR_CODE.NONE:
                         raise RuntimeError(f"Login failed. ERROR: {ret}")
 
-                self.transport.write_packet(read_regs_packet)
-                if self.debug:
-                    log.info("TX <- %s", bytes_to_hex(read_regs_packet))
-
-                received = self.transport.read_edmi_packet()
-                payload = edmi_pre_process(received)
-                if self.debug:
-                    log.info("RX <- %s", bytes_to_hex(payload))
-
-                ret = edmi_validate_crc(payload)
-                if ret != EDMI_ERROR_CODE.NONE:
-                    raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
+                payload = self._txrx(regs_packet)
 
                 err = edmi_parse_read_registers_answer(payload, regs=regs)
                 return regs, err
@@ -220,16 +203,18 @@ class Media:
                     self._safe_disconnect()
 
     def flush_input(self) -> None:
-        with self._lock:
-            try:
-                self._ensure_connected()
-                self.transport.flush_input()
-            except SerialNotReadyError:
-                raise
-            except Exception:
-                log.error("Flush operation failed", exc_info=True)
-                self._safe_disconnect()
-                raise
+        # No Media lock here, or a flush would wait out a whole profile read.
+        # SerialTransport.flush_input takes the transport's exchange_lock, so
+        # it waits for at most the exchange in flight and never splits one.
+        try:
+            self._ensure_connected()
+            self.transport.flush_input()
+        except SerialNotReadyError:
+            raise
+        except Exception:
+            log.error("Flush operation failed", exc_info=True)
+            self._safe_disconnect()
+            raise
 
     def edmi_test_login_meters(self, meters: Iterable[Any]) -> list[int]:
         ok_serials: list[int] = []
@@ -297,40 +282,18 @@ class Media:
                 self._ensure_connected()
 
                 if do_login:
-                    self.transport.write_packet(wlogin_packet)
-                    if self.debug:
-                        log.info("TX <- %s", bytes_to_hex(wlogin_packet))
-
-                    received = self.transport.read_edmi_packet()
-                    payload = edmi_pre_process(received)
-                    if self.debug:
-                        log.info("RX <- %s", bytes_to_hex(payload))
-
-                    ret = edmi_validate_crc(payload)
-                    if ret != EDMI_ERROR_CODE.NONE:
-                        raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
+                    payload = self._txrx(wlogin_packet)
 
                     ret = edmi_parse_login_answer(payload)
                     if ret != EDMI_ERROR_CODE.NONE:
                         raise RuntimeError(f"Login failed. ERROR: {ret}")
 
                 info_regs = edmi_get_file_info_regs(survey)
-                info_regs_packet = edmi_create_read_registers_packet(
-                    serial=serial_number,
-                    regs=[int(reg.Address) for reg in info_regs],
+                info_regs_packet = read_regs_packet(
+                    serial_number,
+                    tuple(int(reg.Address) for reg in info_regs),
                 )
-                self.transport.write_packet(info_regs_packet)
-                if self.debug:
-                    log.info("TX <- %s", bytes_to_hex(info_regs_packet))
-
-                received = self.transport.read_edmi_packet()
-                payload = edmi_pre_process(received)
-                if self.debug:
-                    log.info("RX <- %s", bytes_to_hex(payload))
-
-                ret = edmi_validate_crc(payload)
-                if ret != EDMI_ERROR_CODE.NONE:
-                    raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
+                payload = self._txrx(info_regs_packet)
 
                 err = edmi_parse_read_registers_answer(payload, info_regs)
                 if err != EDMI_ERROR_CODE.NONE:
@@ -355,24 +318,14 @@ class Media:
                         stale_keys = [key for key in self._profile_read_limit_cache if key[0] == int(survey)]
                         for key in stale_keys:
                             del self._profile_read_limit_cache[key]
+                            self._profile_probe_counter.pop(key, None)
                         return profile_spec, [], err
 
                 info_access_packet = edmi_create_read_profile_info_access_packet(
                     serial_number,
                     survey,
                 )
-                self.transport.write_packet(info_access_packet)
-                if self.debug:
-                    log.info("TX <- %s", bytes_to_hex(info_access_packet))
-
-                received = self.transport.read_edmi_packet()
-                payload = edmi_pre_process(received)
-                if self.debug:
-                    log.info("RX <- %s", bytes_to_hex(payload))
-
-                ret = edmi_validate_crc(payload)
-                if ret != EDMI_ERROR_CODE.NONE:
-                    raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
+                payload = self._txrx(info_access_packet)
 
                 err = edmi_parse_read_profile_info_access_payload(payload, file_info)
                 if err != EDMI_ERROR_CODE.NONE:
@@ -392,22 +345,11 @@ class Media:
                 if file_info.ChannelsCount > 0:
                     for ch in range(file_info.ChannelsCount):
                         ch_regs = edmi_get_file_channel_regs(survey, ch)
-                        ch_regs_packet = edmi_create_read_registers_packet(
-                            serial=serial_number,
-                            regs=[int(reg.Address) for reg in ch_regs],
+                        ch_regs_packet = read_regs_packet(
+                            serial_number,
+                            tuple(int(reg.Address) for reg in ch_regs),
                         )
-                        self.transport.write_packet(ch_regs_packet)
-                        if self.debug:
-                            log.info("TX <- %s", bytes_to_hex(ch_regs_packet))
-
-                        received = self.transport.read_edmi_packet()
-                        payload = edmi_pre_process(received)
-                        if self.debug:
-                            log.info("RX <- %s", bytes_to_hex(payload))
-
-                        ret = edmi_validate_crc(payload)
-                        if ret != EDMI_ERROR_CODE.NONE:
-                            raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
+                        payload = self._txrx(ch_regs_packet)
 
                         err = edmi_parse_read_registers_answer(payload, ch_regs)
                         if err != EDMI_ERROR_CODE.NONE:
@@ -461,18 +403,7 @@ class Media:
                         search.DateTime,
                         search.DirOrResult,
                     )
-                    self.transport.write_packet(packet)
-                    if self.debug:
-                        log.info("TX <- %s", bytes_to_hex(packet))
-
-                    received = self.transport.read_edmi_packet()
-                    payload = edmi_pre_process(received)
-                    if self.debug:
-                        log.info("RX <- %s", bytes_to_hex(payload))
-
-                    ret = edmi_validate_crc(payload)
-                    if ret != EDMI_ERROR_CODE.NONE:
-                        raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
+                    payload = self._txrx(packet)
 
                     err = edmi_parse_search_profile_payload(payload, search)
                     if err != EDMI_ERROR_CODE.NONE:
@@ -514,6 +445,7 @@ class Media:
                         per_read_limit = max(1, int(math.ceil(86400 / profile_spec.Interval)))
                     else:
                         per_read_limit = 48
+                    max_limit = per_read_limit
                     if cached_limit:
                         per_read_limit = min(per_read_limit, cached_limit)
                     # if file_info.RecordsCount > 0:
@@ -523,9 +455,18 @@ class Media:
                     remaining = read.RecordsCount
                     next_start = read.StartRecord
                     records_read = 0
+                    _dbg = self.debug and log.isEnabledFor(logging.INFO)
+                    probe_count = self._profile_probe_counter.get(cache_key, 0)
                     while remaining > 0:
                         chunk = min(remaining, per_read_limit)
-                        if self.debug:
+                        probing = (
+                            per_read_limit < max_limit
+                            and probe_count >= _PROFILE_PROBE_INTERVAL
+                            and remaining > per_read_limit
+                        )
+                        if probing:
+                            chunk = min(remaining, per_read_limit + _PROFILE_PROBE_STEP, max_limit)
+                        if _dbg:
                             log.info(
                                 "FILE_READ start=%s count=%s size=%s",
                                 next_start,
@@ -541,18 +482,7 @@ class Media:
                             read.RecordOffset,
                             read.RecordSize,
                         )
-                        self.transport.write_packet(read_packet)
-                        if self.debug:
-                            log.info("TX <- %s", bytes_to_hex(read_packet))
-
-                        received = self.transport.read_edmi_packet()
-                        payload = edmi_pre_process(received)
-                        if self.debug:
-                            log.info("RX <- %s", bytes_to_hex(payload))
-
-                        ret = edmi_validate_crc(payload)
-                        if ret != EDMI_ERROR_CODE.NONE:
-                            raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
+                        payload_mv = self._txrx(read_packet)
 
                         read_resp = EDMIReadFile(
                             StartRecord=next_start,
@@ -560,37 +490,66 @@ class Media:
                             RecordOffset=read.RecordOffset,
                             RecordSize=read.RecordSize,
                         )
-                        fields, err = edmi_parse_read_profile_payload(payload, read_resp, profile_spec)
+                        fields, err = edmi_parse_read_profile_payload(payload_mv, read_resp, profile_spec)
                         if err != EDMI_ERROR_CODE.NONE:
                             return fields_all, err
 
                         fields_all.extend(fields)
                         channels_count = profile_spec.ChannelsCount
-                        if self.debug:
-                            data_len = max(0, len(payload) - 3)
+                        if _dbg:
+                            payload_len = payload_mv.nbytes
                             log.info(
                                 "FILE_READ_RESP req_count=%s resp_count=%s payload_len=%s data_len=%s record_size=%s channels=%s fields=%s",
                                 chunk,
                                 read_resp.RecordsCount,
-                                len(payload),
-                                data_len,
+                                payload_len,
+                                max(0, payload_len - 3),
                                 read_resp.RecordSize,
                                 channels_count,
                                 len(fields),
                             )
                         if read_resp.RecordsCount > 0 and read_resp.RecordsCount < chunk:
-                            per_read_limit = min(per_read_limit, read_resp.RecordsCount)
-                            self._profile_read_limit_cache[cache_key] = per_read_limit
-                            if self.debug:
-                                log.info(
-                                    "FILE_READ_LIMIT learned=%s key=%s",
-                                    per_read_limit,
-                                    cache_key,
-                                )
+                            if probing and read_resp.RecordsCount >= per_read_limit:
+                                # The meter capped the larger chunk: adopt its cap and
+                                # wait _PROFILE_PROBE_BACKOFF full replies.
+                                if read_resp.RecordsCount > per_read_limit:
+                                    per_read_limit = read_resp.RecordsCount
+                                    self._profile_read_limit_cache[cache_key] = per_read_limit
+                                    if _dbg:
+                                        log.info(
+                                            "FILE_READ_LIMIT grown=%s key=%s",
+                                            per_read_limit,
+                                            cache_key,
+                                        )
+                                probe_count = _PROFILE_PROBE_INTERVAL - _PROFILE_PROBE_BACKOFF
+                            else:
+                                per_read_limit = min(per_read_limit, read_resp.RecordsCount)
+                                self._profile_read_limit_cache[cache_key] = per_read_limit
+                                probe_count = 0
+                                if _dbg:
+                                    log.info(
+                                        "FILE_READ_LIMIT learned=%s key=%s",
+                                        per_read_limit,
+                                        cache_key,
+                                    )
+                        elif read_resp.RecordsCount == chunk:
+                            if probing:
+                                per_read_limit = chunk
+                                self._profile_read_limit_cache[cache_key] = per_read_limit
+                                probe_count = 0
+                                if _dbg:
+                                    log.info(
+                                        "FILE_READ_LIMIT grown=%s key=%s",
+                                        per_read_limit,
+                                        cache_key,
+                                    )
+                            elif chunk == per_read_limit:
+                                probe_count += 1
+                        self._profile_probe_counter[cache_key] = probe_count
                         if channels_count <= 0:
                             return fields_all, EDMI_ERROR_CODE.REQUEST_WRONG_LENGTH
                         records_returned = len(fields) // channels_count
-                        if self.debug:
+                        if _dbg:
                             log.info("Number of records: %s", records_returned)
                         if records_returned <= 0:
                             return fields_all, EDMI_ERROR_CODE.RESPONSE_WRONG_LENGTH
@@ -0,0 +1,125 @@
+# driver/interface/session.py
+from __future__ import annotations
+
+import logging
+from functools import cached_property, lru_cache
+from typing import Sequence, Tuple
+
+from driver.edmi_enums import EDMI_ERROR_CODE
+from driver.frames_codec.generics import edmi_unpack_frame, wake_up_seq
+from driver.frames_codec.login_frame import edmi_create_login_packet, edmi_parse_login_answer
+from driver.frames_codec.read_registers_frame import (
+    edmi_create_read_registers_packet,
+    edmi_parse_read_registers_answer,
+)
+from driver.interface.edmi_structs import EDMIRegister, RegisterBank
+from driver.transport.serial_transport import SerialTransport
+from driver.utils import bytes_to_hex, combine_packets
+
+log = logging.getLogger(__name__)
+
+
+class CrcError(RuntimeError):
+    """Raised by txrx when a response frame fails CRC validation."""
+
+    def __init__(self, code: EDMI_ERROR_CODE) -> None:
+        super().__init__(f"Corrupted data. CRC not match. ERROR: {code}")
+        self.code = code
+
+
+# Media builds one entry per profile channel (up to 16) plus the info and
+# user register sets for each meter, so 16 slots would evict every read.
+@lru_cache(maxsize=128)
+def read_regs_packet(serial: int, addrs: Tuple[int, ...]) -> bytes:
+    """Read-register request for (serial, addresses); repeated reads reuse the bytes."""
+    return edmi_create_read_registers_packet(serial=serial, regs=addrs)
+
+
+def txrx(transport: SerialTransport, packet: bytes, *, debug: bool = False) -> memoryview:
+    """
+    Send one request frame and return the de-stuffed reply.
+
+    Holds the transport's exchange_lock across the write and the read.
+    Raises CrcError (a RuntimeError) when the reply fails CRC validation.
+    """
+    dbg = debug and log.isEnabledFor(logging.INFO)
+    with transport.exchange_lock:
+        transport.write_packet(packet)
+        if dbg:
+            log.info("TX <- %s", bytes_to_hex(packet))
+        payload, ret = edmi_unpack_frame(transport.read_edmi_packet())
+    if dbg:
+        log.info("RX <- %s", bytes_to_hex(payload))
+
+    if ret != EDMI_ERROR_CODE.NONE:
+        raise CrcError(ret)
+    return payload
+
+
+class Session:
+    """
+    Login + register reads for one meter over an already connected
+    SerialTransport.
+
+    Request bytes are built once: the wake-up+login frame per session and
+    read-register frames per (serial, address tuple).
+    """
+
+    def __init__(
+        self,
+        transport: SerialTransport,
+        username: str,
+        password: str,
+        serial: int,
+        *,
+        debug: bool = False,
+    ) -> None:
+        self.transport = transport
+        self.username = username
+        self.password = password
+        self.serial = serial
+        self.debug = debug
+
+    @cached_property
+    def _login_bytes(self) -> bytes:
+        login_packet = edmi_create_login_packet(
+            username=self.username,
+            password=self.password,
+            serial=self.serial,
+        )
+        return combine_packets(wake_up_seq(), login_packet)
+
+    def _txrx(self, packet: bytes) -> memoryview:
+        return txrx(self.transport, packet, debug=self.debug)
+
+    def login(self) -> None:
+        payload = self._txrx(self._login_bytes)
+        ret = edmi_parse_login_answer(payload)
+        if ret != EDMI_ERROR_CODE.NONE:
+            raise RuntimeError(f"Login failed. ERROR: {ret}")
+
+    def read_registers(
+        self,
+        regs: RegisterBank | Sequence[EDMIRegister],
+    ) -> Tuple[memoryview, EDMI_ERROR_CODE]:
+        """Read and parse `regs` in place; returns (payload, parse error)."""
+        if isinstance(regs, RegisterBank):
+            addrs = tuple(int(a) for a in regs.Addresses)
+        else:
+            addrs = tuple(int(reg.Address) for reg in regs)
+        payload = self._txrx(read_regs_packet(self.serial, addrs))
+        return payload, edmi_parse_read_registers_answer(payload, regs)
+
+
+def login_and_read(
+    transport: SerialTransport,
+    username: str,
+    password: str,
+    serial: int,
+    regs: RegisterBank | Sequence[EDMIRegister],
+    *,
+    debug: bool = False,
+) -> Tuple[memoryview, EDMI_ERROR_CODE]:
+    session = Session(transport, username, password, serial, debug=debug)
+    session.login()
+    return session.read_registers(regs)
@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 import argparse
 import errno
+import io
 import sys
 import time
 import serial
 
+from driver.transport.low_latency import enable_low_latency
+
 
 REPLY_HEX = "02 45 01 2b 16 68 0e fa aa 45 ff ff 06 ee 8c 03"
 
@@ -17,7 +20,7 @@ def parse_hex_bytes(s: str) -> bytes:
 
 
 def format_hex(data: bytes) -> str:
-    return " ".join(f"{b:02x}" for b in data)
+    return data.hex(" ")
 
 
 def open_serial(port: str, baud: int, timeout: float) -> serial.Serial:
@@ -30,6 +33,7 @@ def open_serial(port: str, baud: int, timeout: float) -> serial.Serial:
         )
         ser.reset_input_buffer()
         ser.reset_output_buffer()
+        enable_low_latency(ser)
         return ser
 
     except serial.SerialException as e:
@@ -46,41 +50,33 @@ def read_one_message(ser: serial.Serial, overall_timeout: float) -> bytes:
     """
     Waits for the first incoming bytes, then collects bytes until the line
     stays idle for a short gap, returning the collected message.
+
+    Every wait is a blocking read with ser.timeout set to the idle gap, so
+    the driver wakes us as soon as data arrives; an empty read means the
+    line was idle for the whole gap.
     """
+    idle_gap_s = max(ser.timeout or 0.1, 0.1)
+    if ser.timeout != idle_gap_s:
+        ser.timeout = idle_gap_s
+
     start = time.monotonic()
-    buf = bytearray()
 
-    # Phase 1: wait for first byte(s)
+    # Phase 1: wait for first byte
     while True:
-        if overall_timeout is not None and (time.monotonic() - start) >= overall_timeout:
-            raise TimeoutError("Timeout waiting for first incoming data")
-
-        n = ser.in_waiting
-        chunk = ser.read(n if n > 0 else 1)
-        if chunk:
-            buf.extend(chunk)
+        first = ser.read(1)
+        if first:
             break
-
-    # Phase 2: keep reading until idle gap
-    idle_gap_s = max(ser.timeout or 0.1, 0.1)
-    last_rx = time.monotonic()
-
-    while True:
         if overall_timeout is not None and (time.monotonic() - start) >= overall_timeout:
-            break
+            raise TimeoutError("Timeout waiting for first incoming data")
 
-        n = ser.in_waiting
-        if n > 0:
-            chunk = ser.read(n)
-            if chunk:
-                buf.extend(chunk)
-                last_rx = time.monotonic()
-                continue
+    buf = bytearray(first)
 
-        if (time.monotonic() - last_rx) >= idle_gap_s:
+    # Phase 2: drain whatever is queued; stop after one idle gap
+    while overall_timeout is None or (time.monotonic() - start) < overall_timeout:
+        chunk = ser.read(ser.in_waiting or 1)
+        if not chunk:
             break
-
-        time.sleep(0.01)
+        buf.extend(chunk)
 
     return bytes(buf)
 
@@ -95,21 +91,26 @@ def main() -> int:
 
     reply_bytes = parse_hex_bytes(args.reply)
 
+    out = io.StringIO()
+    _p = out.write
+
     ser = open_serial(args.port, args.baud, timeout=0.2)
     try:
         first = read_one_message(ser, overall_timeout=args.timeout)
-        print(f"RX1 ({len(first)} bytes): {format_hex(first)}")
+        _p(f"RX1 ({len(first)} bytes): {format_hex(first)}\n")
 
         ser.write(reply_bytes)
         ser.flush()
-        print(f"TX  ({len(reply_bytes)} bytes): {format_hex(reply_bytes)}")
+        _p(f"TX  ({len(reply_bytes)} bytes): {format_hex(reply_bytes)}\n")
 
         second = read_one_message(ser, overall_timeout=args.timeout)
-        print(f"RX2 ({len(second)} bytes): {format_hex(second)}")
+        _p(f"RX2 ({len(second)} bytes): {format_hex(second)}\n")
 
     finally:
         if ser.is_open:
             ser.close()
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
 
     return 0
 
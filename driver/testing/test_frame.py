@@ -1,28 +1,44 @@
-from driver.transport.serial_transport import SerialTransport
+from driver.transport.serial_transport import SerialConfig, SerialTransport
 from driver.serial_settings import PORT, BAUD, TIMEOUT_S
-import serial
+import io
+import os
+import sys
 import time
 
 from driver.frames_codec.login_frame import edmi_begin_init_packet,  edmi_post_process, \
-    edmi_create_login_packet, edmi_parse_login_answer, wake_up_seq
-from driver.frames_codec.generics import edmi_validate_crc, edmi_pre_process
+    edmi_create_login_packet, edmi_parse_login_answer
+from driver.frames_codec.generics import edmi_unpack_frame, wake_up_seq
 
 from driver.meters_config import SERIAL_NUMBER
-from driver.utils import bytes_to_hex, combine_packets
+from driver.utils import combine_packets
 
-from driver.edmi_enums import EDMI_COMMAND_TYPE, EDMI_COMMAND_EXTENSION
+from driver.edmi_enums import EDMI_COMMAND_TYPE, EDMI_COMMAND_EXTENSION, EDMI_ERROR_CODE
+
+# Per-frame hex dumps; set EDMI_DEBUG=1 to enable.
+DEBUG = bool(int(os.environ.get("EDMI_DEBUG", "0")))
+
+# Wake-up + login for the fixed test credentials, built once at import.
+_WAKEUP = wake_up_seq()
+_LOGIN = edmi_create_login_packet(
+    username="EDMA",
+    password="IMDEIMDE",
+    serial=251308613
+)
+WLOGIN_BYTES = combine_packets(_WAKEUP, _LOGIN)
 
 def main() -> None:
-    t_start = time.perf_counter()
+    t_start = time.perf_counter_ns()
+    out = io.StringIO()
+    _p = out.write
 
-    ser = serial.Serial(
+    cfg = SerialConfig(
         port=PORT,
         baudrate=BAUD,
-        timeout=TIMEOUT_S,
-        write_timeout=TIMEOUT_S,
-        exclusive=True
+        timeout_s=TIMEOUT_S,
+        write_timeout_s=TIMEOUT_S,
+        exclusive=True,
     )
-    transport = SerialTransport(ser=ser)
+    transport = SerialTransport(cfg)
 
     try:
         # init_packet = edmi_begin_init_packet(
@@ -30,44 +46,39 @@ def main() -> None:
         #     command_type=EDMI_COMMAND_TYPE.LOGIN,
         #     command_extension=EDMI_COMMAND_EXTENSION.NO_EXTENSION,
         # )
-        wake_up = wake_up_seq()
-        login_packet = edmi_create_login_packet(
-            username="EDMA",
-            password="IMDEIMDE",
-            serial=251308613
-        )
-
-        wlogin_packet = combine_packets(wake_up, login_packet)
-
         transport.connect()
 
         # --- measure write ---
-        t_write_start = time.perf_counter()
-        transport.write_packet(wlogin_packet)
-        print(f"TX <- {bytes_to_hex(wlogin_packet)}")
-        t_write_end = time.perf_counter()
+        t_write_start = time.perf_counter_ns()
+        transport.write_packet(WLOGIN_BYTES)
+        if DEBUG:
+            _p(f"TX <- {WLOGIN_BYTES.hex(' ')}\n")
+        t_write_end = time.perf_counter_ns()
 
         # --- measure read ---
-        t_read_start = time.perf_counter()
+        t_read_start = time.perf_counter_ns()
         received = transport.read_edmi_packet()
-        payload = edmi_pre_process(received)
-        if not edmi_validate_crc(payload):
+        payload, ret = edmi_unpack_frame(received)
+        if ret != EDMI_ERROR_CODE.NONE:
             raise Exception("Corrupted data. CRC does not match")
-        t_read_end = time.perf_counter()
-        print(edmi_parse_login_answer(payload))
-        print(f"RX <- {bytes_to_hex(payload)}")
+        t_read_end = time.perf_counter_ns()
+        _p(f"{edmi_parse_login_answer(payload)}\n")
+        if DEBUG:
+            _p(f"RX <- {payload.hex(' ')}\n")
 
-        print(f"write time : {(t_write_end - t_write_start) * 1e3:.3f} ms")
-        print(f"read time  : {(t_read_end - t_read_start) * 1e3:.3f} ms")
+        _p(f"write time : {(t_write_end - t_write_start) / 1_000_000:.3f} ms\n")
+        _p(f"read time  : {(t_read_end - t_read_start) / 1_000_000:.3f} ms\n")
 
     except Exception as e:
         raise e
     
     finally:
-        transport.disconnect()
+        transport.close()
 
-        t_end = time.perf_counter()
-        print(f"total time : {(t_end - t_start) * 1e3:.3f} ms")
+        t_end = time.perf_counter_ns()
+        _p(f"total time : {(t_end - t_start) / 1_000_000:.3f} ms\n")
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
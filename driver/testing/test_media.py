@@ -1,23 +1,26 @@
 from __future__ import annotations
 
+import io
+import sys
 import time
 from datetime import datetime
 
-from driver.edmi_enums import EDMI_TYPE
-from driver.interface.edmi_structs import (
-    EDMIDateTime,
-    EDMIFileChannelInfo,
-    EDMIProfileSpec,
-    EDMISurvey,
-)
+from driver.interface.edmi_structs import EDMISurvey
 from driver.interface.media import Media
 from driver.meters_config import PASWORD, SERIAL_NUMBER, USERNAME
 from driver.serial_settings import BAUD, PORT, TIMEOUT_S
 from driver.transport.serial_transport import SerialConfig, SerialTransport
 
+FROM_DT_STR = "2026-01-18 00:30:00"
+TO_DT_STR = "2026-01-20 10:00:00"
+FROM_DT = datetime.fromisoformat(FROM_DT_STR)
+TO_DT = datetime.fromisoformat(TO_DT_STR)
+
 
 def main() -> None:
-    t_start = time.perf_counter()
+    t_start = time.perf_counter_ns()
+    out = io.StringIO()
+    _p = out.write
 
     cfg = SerialConfig(
         port=PORT,
@@ -32,61 +35,36 @@ def main() -> None:
     try:
         transport.connect()
 
-        from_dt_str = "2026-01-18 00:30:00"
-        to_dt_str = "2026-01-20 10:00:00"
-        from_dt = datetime.strptime(from_dt_str, "%Y-%m-%d %H:%M:%S")
-        to_dt = datetime.strptime(to_dt_str, "%Y-%m-%d %H:%M:%S")
-
-        print(f"Requested window: {from_dt_str} -> {to_dt_str} (survey {EDMISurvey.LS01.name})")
-        channels = [
-            EDMIFileChannelInfo(
-                Type=EDMI_TYPE.FLOAT,
-                UnitCode=0,
-                ScalingCode=0,
-                ScalingFactor=1.0,
-                Name=f"CH{idx}",
-            )
-            for idx in range(EDMIProfileSpec.MAX_CHANNELS)
-        ]
-        profile_spec = EDMIProfileSpec(
-            Survey=int(EDMISurvey.LS01),
-            Interval=0,
-            FromDateTime=EDMIDateTime(0, 0, 0, 0, 0, 0, True),
-            ToDateTime=EDMIDateTime(0, 0, 0, 0, 0, 0, True),
-            RecordsCount=0,
-            ChannelsCount=len(channels),
-            ChannelsInfo=channels,
-            Name="",
-        )
+        _p(f"Requested window: {FROM_DT_STR} -> {TO_DT_STR} (survey {EDMISurvey.LS01.name})\n")
         profile_spec, fields, err = media.edmi_read_profile(
             username=USERNAME,
             password=PASWORD,
             serial_number=SERIAL_NUMBER,
             survey=EDMISurvey.LS03,
-            from_datetime=from_dt,
-            to_datetime=to_dt,
+            from_datetime=FROM_DT,
+            to_datetime=TO_DT,
             max_records=None,
-            profile_spec=profile_spec,
+            profile_spec=None,
             keep_open=True,
             do_login=True,
         )
 
-        print(
-            "Profile metadata:",
-            {
-                "start_record": getattr(profile_spec, "StartRecord", None),
-                "records_count": profile_spec.RecordsCount,
-                "interval_sec": profile_spec.Interval,
-            },
-        )
+        metadata = {
+            "start_record": getattr(profile_spec, "StartRecord", None),
+            "records_count": profile_spec.RecordsCount,
+            "interval_sec": profile_spec.Interval,
+        }
+        _p(f"Profile metadata: {metadata}\n")
         if err is not None:
-            print(f"Profile read error: {err}")
-        print(f"Fields returned: {len(fields)}")
+            _p(f"Profile read error: {err}\n")
+        _p(f"Fields returned: {len(fields)}\n")
 
     finally:
         transport.close()
-        t_end = time.perf_counter()
-        print(f"total time : {(t_end - t_start) * 1e3:.3f} ms")
+        t_end = time.perf_counter_ns()
+        _p(f"total time : {(t_end - t_start) / 1_000_000:.3f} ms\n")
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
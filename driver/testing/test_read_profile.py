@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import io
+import os
+import sys
 from datetime import datetime
+from collections import deque
+from typing import Iterator, Sequence
 
 from driver.edmi_enums import EDMI_ERROR_CODE
-from driver.frames_codec.generics import edmi_pre_process, edmi_validate_crc, wake_up_seq
+from driver.frames_codec.generics import edmi_unpack_frame, wake_up_seq
 from driver.frames_codec.login_frame import edmi_create_login_packet, edmi_parse_login_answer
 from driver.frames_codec.read_profile_frame import (
     edmi_create_read_profile_info_access_packet,
@@ -17,13 +22,11 @@ from driver.frames_codec.read_profile_frame import (
     edmi_set_file_channel_info,
     edmi_set_profile_info,
 )
-from driver.frames_codec.read_registers_frame import (
-    edmi_create_read_registers_packet,
-    edmi_parse_read_registers_answer,
-)
+from driver.frames_codec.read_registers_frame import edmi_parse_read_registers_answer
 from driver.interface.edmi_structs import (
     EDMIDateTime,
     EDMIFileChannelInfo,
+    EDMIFileField,
     EDMIFileInfo,
     EDMIProfileSpec,
     EDMIReadFile,
@@ -31,10 +34,154 @@ from driver.interface.edmi_structs import (
     EDMISearchFileDir,
     EDMISurvey,
 )
+from driver.interface.session import read_regs_packet, txrx
 from driver.meters_config import PASWORD, SERIAL_NUMBER, USERNAME
 from driver.serial_settings import BAUD, PORT, TIMEOUT_S
 from driver.transport.serial_transport import SerialConfig, SerialTransport
-from driver.utils import bytes_to_hex, combine_packets
+from driver.utils import combine_packets
+
+# Send independent requests (channel reads, the two searches) in one write
+# before reading any reply. Only enable for meters known to queue
+# back-to-back requests; otherwise each request goes out as soon as the
+# previous reply has arrived.
+PIPELINE_BATCH = False
+
+# Full hex dump of the profile payload; set EDMI_DEBUG=1 to enable.
+DEBUG = bool(int(os.environ.get("EDMI_DEBUG", "0")))
+
+_OUT = io.StringIO()
+_p = _OUT.write
+
+# Target reply size for one profile chunk; keeps each response to about one
+# USB transfer and bounds what has to be buffered before parsing.
+PROFILE_CHUNK_BYTES = 1024
+
+# Profile window read by main().
+FROM_DT = datetime.fromisoformat("2026-01-18 00:30:00")
+TO_DT = datetime.fromisoformat("2026-01-20 10:00:00")
+
+
+def _to_edmi_datetime(dt: datetime) -> EDMIDateTime:
+    return EDMIDateTime(dt.year % 100, dt.month, dt.day, dt.hour, dt.minute, dt.second, False)
+
+
+_FROM_DT_EDMI = _to_edmi_datetime(FROM_DT)
+_TO_DT_EDMI = _to_edmi_datetime(TO_DT)
+
+
+# Wake-up + login bytes only depend on the configured credentials.
+_WAKEUP = wake_up_seq()
+_LOGIN = edmi_create_login_packet(username=USERNAME, password=PASWORD, serial=SERIAL_NUMBER)
+WLOGIN_BYTES = combine_packets(_WAKEUP, _LOGIN)
+
+
+def pipeline_read(
+    transport: SerialTransport,
+    packets: Sequence[bytes],
+    depth: int | None = None,
+) -> list[tuple[memoryview, EDMI_ERROR_CODE]]:
+    """
+    Send request frames ahead of their replies and return the unpacked
+    (payload, crc_err) replies in request order.
+
+    depth is the number of requests allowed in flight; None sends them all
+    in a single write. Replies are parsed by the caller only after the last
+    one arrives, so parsing never delays the next request.
+    """
+    if not packets:
+        return []
+    if depth is None:
+        depth = len(packets)
+
+    sent = min(depth, len(packets))
+    transport.write_packets(*packets[:sent])
+
+    payloads: list[tuple[memoryview, EDMI_ERROR_CODE]] = []
+    for _ in range(len(packets)):
+        payloads.append(edmi_unpack_frame(transport.read_edmi_packet()))
+        if sent < len(packets):
+            transport.write_packet(packets[sent])
+            sent += 1
+    return payloads
+
+
+def stream_profile(
+    transport: SerialTransport,
+    survey: int,
+    start_record: int,
+    record_count: int,
+    record_size: int,
+    profile_spec: EDMIProfileSpec,
+    depth: int = 1,
+) -> Iterator[EDMIFileField]:
+    """
+    Read records [start_record, start_record + record_count) in chunks of
+    about PROFILE_CHUNK_BYTES and yield fields as each chunk is parsed.
+
+    Up to `depth` chunk requests are kept in flight. If the meter returns
+    fewer records than asked, reading resumes right after the last record
+    received and replies to requests already sent past that point are
+    discarded. Stop iterating early only if the port is flushed afterwards.
+    """
+    chunk = max(1, PROFILE_CHUNK_BYTES // record_size) if record_size > 0 else 64
+    end = start_record + record_count
+    next_start = start_record
+    expected = start_record
+    in_flight: deque[EDMIReadFile] = deque()
+
+    def submit() -> None:
+        nonlocal next_start
+        read = EDMIReadFile(
+            StartRecord=next_start,
+            RecordsCount=min(chunk, end - next_start),
+            RecordOffset=0,
+            RecordSize=record_size,
+        )
+        transport.write_packet(
+            edmi_create_read_profile_packet(
+                SERIAL_NUMBER,
+                survey,
+                read.StartRecord,
+                read.RecordsCount,
+                read.RecordOffset,
+                read.RecordSize,
+            )
+        )
+        in_flight.append(read)
+        next_start += read.RecordsCount
+
+    while next_start < end and len(in_flight) < depth:
+        submit()
+
+    while in_flight:
+        read = in_flight.popleft()
+        payload, ret = edmi_unpack_frame(transport.read_edmi_packet())
+        if ret != EDMI_ERROR_CODE.NONE:
+            raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
+        if read.StartRecord != expected:
+            continue  # sent before an earlier chunk came back short
+
+        requested = read.RecordsCount
+        fields, err = edmi_parse_read_profile_payload(payload, read, profile_spec)
+        if err != EDMI_ERROR_CODE.NONE:
+            raise RuntimeError(f"Read profile error: {err}")
+        if DEBUG:
+            _p(payload.hex(" ") + "\n")
+
+        got = read.RecordsCount
+        if got <= 0:
+            # No more data: drain outstanding replies and stop.
+            for _ in in_flight:
+                transport.read_edmi_packet()
+            in_flight.clear()
+            break
+        expected += got
+        if got < requested:
+            next_start = expected
+        while next_start < end and len(in_flight) < depth:
+            submit()
+
+        yield from fields
 
 
 def main() -> None:
@@ -50,38 +197,18 @@ def main() -> None:
 
     try:
         survey = int(EDMISurvey.LS01)
-        from_dt = datetime.strptime("2026-01-18 00:30:00", "%Y-%m-%d %H:%M:%S")
-        to_dt = datetime.strptime("2026-01-20 10:00:00", "%Y-%m-%d %H:%M:%S")
-
-        wake_up = wake_up_seq()
-        login_packet = edmi_create_login_packet(
-            username=USERNAME,
-            password=PASWORD,
-            serial=SERIAL_NUMBER,
-        )
-        wlogin_packet = combine_packets(wake_up, login_packet)
 
-        transport.write_packet(wlogin_packet)
-        received = transport.read_edmi_packet()
-        payload = edmi_pre_process(received)
-        ret = edmi_validate_crc(payload)
-        if ret != EDMI_ERROR_CODE.NONE:
-            raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
+        payload = txrx(transport, WLOGIN_BYTES)
         ret = edmi_parse_login_answer(payload)
         if ret != EDMI_ERROR_CODE.NONE:
             raise RuntimeError(f"Login failed. ERROR: {ret}")
 
         info_regs = edmi_get_file_info_regs(survey)
-        info_regs_packet = edmi_create_read_registers_packet(
-            serial=SERIAL_NUMBER,
-            regs=[int(reg.Address) for reg in info_regs],
+        info_regs_packet = read_regs_packet(
+            SERIAL_NUMBER,
+            tuple(int(reg.Address) for reg in info_regs),
         )
-        transport.write_packet(info_regs_packet)
-        received = transport.read_edmi_packet()
-        payload = edmi_pre_process(received)
-        ret = edmi_validate_crc(payload)
-        if ret != EDMI_ERROR_CODE.NONE:
-            raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
+        payload = txrx(transport, info_regs_packet)
         err = edmi_parse_read_registers_answer(payload, info_regs)
         if err != EDMI_ERROR_CODE.NONE:
             raise RuntimeError(f"Read registers error: {err}")
@@ -104,28 +231,30 @@ def main() -> None:
             SERIAL_NUMBER,
             survey,
         )
-        transport.write_packet(info_access_packet)
-        received = transport.read_edmi_packet()
-        payload = edmi_pre_process(received)
-        ret = edmi_validate_crc(payload)
-        if ret != EDMI_ERROR_CODE.NONE:
-            raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
+        payload = txrx(transport, info_access_packet)
         err = edmi_parse_read_profile_info_access_payload(payload, file_info)
         if err != EDMI_ERROR_CODE.NONE:
             raise RuntimeError(f"Profile access error: {err}")
 
         channels: list[EDMIFileChannelInfo] = []
         if file_info.ChannelsCount > 0:
-            for ch in range(file_info.ChannelsCount):
-                ch_regs = edmi_get_file_channel_regs(survey, ch)
-                ch_regs_packet = edmi_create_read_registers_packet(
-                    serial=SERIAL_NUMBER,
-                    regs=[int(reg.Address) for reg in ch_regs],
+            ch_regs_list = [
+                edmi_get_file_channel_regs(survey, ch)
+                for ch in range(file_info.ChannelsCount)
+            ]
+            ch_packets = [
+                read_regs_packet(
+                    SERIAL_NUMBER,
+                    tuple(int(reg.Address) for reg in ch_regs),
                 )
-                transport.write_packet(ch_regs_packet)
-                received = transport.read_edmi_packet()
-                payload = edmi_pre_process(received)
-                ret = edmi_validate_crc(payload)
+                for ch_regs in ch_regs_list
+            ]
+            ch_payloads = pipeline_read(
+                transport,
+                ch_packets,
+                depth=None if PIPELINE_BATCH else 1,
+            )
+            for ch_regs, (payload, ret) in zip(ch_regs_list, ch_payloads):
                 if ret != EDMI_ERROR_CODE.NONE:
                     raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
                 err = edmi_parse_read_registers_answer(payload, ch_regs)
@@ -156,7 +285,7 @@ def main() -> None:
             Name=file_info.Name,
         )
 
-        def _search(dt: EDMIDateTime) -> EDMISearchFile:
+        def _search_submit(dt: EDMIDateTime) -> tuple[EDMISearchFile, bytes]:
             search = EDMISearchFile(
                 StartRecord=file_info.StartRecord,
                 DateTime=dt,
@@ -169,56 +298,53 @@ def main() -> None:
                 search.DateTime,
                 search.DirOrResult,
             )
-            transport.write_packet(packet)
-            received = transport.read_edmi_packet()
-            payload = edmi_pre_process(received)
-            ret = edmi_validate_crc(payload)
+            return search, packet
+
+        def _search_recv(
+            search: EDMISearchFile,
+            reply: tuple[memoryview, EDMI_ERROR_CODE],
+        ) -> None:
+            payload, ret = reply
             if ret != EDMI_ERROR_CODE.NONE:
                 raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
             err = edmi_parse_search_profile_payload(payload, search)
             if err != EDMI_ERROR_CODE.NONE:
                 raise RuntimeError(f"Search error: {err}")
-            return search
-
-        from_dt_edmi = EDMIDateTime(from_dt.year % 100, from_dt.month, from_dt.day, from_dt.hour, from_dt.minute, from_dt.second, False)
-        to_dt_edmi = EDMIDateTime(to_dt.year % 100, to_dt.month, to_dt.day, to_dt.hour, to_dt.minute, to_dt.second, False)
 
-        from_search = _search(from_dt_edmi)
-        to_search = _search(to_dt_edmi)
+        # The two searches are independent: with PIPELINE_BATCH both frames go
+        # out in one write; otherwise the second is sent as soon as the first
+        # reply is in, before that reply is checked and parsed.
+        from_search, from_packet = _search_submit(_FROM_DT_EDMI)
+        to_search, to_packet = _search_submit(_TO_DT_EDMI)
+        from_reply, to_reply = pipeline_read(
+            transport,
+            (from_packet, to_packet),
+            depth=None if PIPELINE_BATCH else 1,
+        )
+        _search_recv(from_search, from_reply)
+        _search_recv(to_search, to_reply)
 
         record_count = to_search.StartRecord - from_search.StartRecord + 1
         if record_count < 1:
             record_count = 1
 
-        read = EDMIReadFile(
-            StartRecord=from_search.StartRecord,
-            RecordsCount=record_count,
-            RecordOffset=0,
-            RecordSize=file_info.RecordSize,
-        )
-        read_packet = edmi_create_read_profile_packet(
-            SERIAL_NUMBER,
+        fields = stream_profile(
+            transport,
             survey,
-            read.StartRecord,
-            read.RecordsCount,
-            read.RecordOffset,
-            read.RecordSize,
+            from_search.StartRecord,
+            record_count,
+            file_info.RecordSize,
+            profile_spec,
+            depth=2 if PIPELINE_BATCH else 1,
         )
-        transport.write_packet(read_packet)
-        received = transport.read_edmi_packet()
-        payload = edmi_pre_process(received)
-        ret = edmi_validate_crc(payload)
-        if ret != EDMI_ERROR_CODE.NONE:
-            raise RuntimeError(f"Corrupted data. CRC not match. ERROR: {ret}")
-        fields, err = edmi_parse_read_profile_payload(payload, read, profile_spec)
-        if err != EDMI_ERROR_CODE.NONE:
-            raise RuntimeError(f"Read profile error: {err}")
+        fields_read = sum(1 for _ in fields)
 
-        print(f"Records read: {len(fields)}")
-        print(bytes_to_hex(payload))
+        _p(f"Records read: {fields_read}\n")
 
     finally:
         transport.close()
+        sys.stdout.write(_OUT.getvalue())
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -1,33 +1,34 @@
-from driver.transport.serial_transport import SerialTransport
+from driver.transport.serial_transport import SerialConfig, SerialTransport
 from driver.serial_settings import PORT, BAUD, TIMEOUT_S
-import serial
+import io
+import os
+import sys
 import time
 
-from driver.frames_codec.login_frame import edmi_begin_init_packet,  edmi_post_process, \
-    edmi_create_login_packet, edmi_parse_login_answer
-from driver.frames_codec.generics import edmi_validate_crc, edmi_pre_process, wake_up_seq
-
-from driver.meters_config import SERIAL_NUMBER
-from driver.utils import bytes_to_hex, combine_packets
+from driver.meters_config import SERIAL_NUMBER, USERNAME, PASWORD
 from driver.edmi_enums import EDMI_REGISTER, EDMI_TYPE
-from driver.frames_codec.read_registers_frame import edmi_create_read_registers_packet,\
-    edmi_parse_read_registers_answer
 from driver.interface.edmi_structs import EDMIRegister, EDMIRegisterFactory
+from driver.interface.session import Session
 from typing import List
 
-from driver.edmi_enums import EDMI_COMMAND_TYPE, EDMI_COMMAND_EXTENSION, EDMI_ERROR_CODE
+from driver.edmi_enums import EDMI_ERROR_CODE
+
+# Per-frame hex dumps; set EDMI_DEBUG=1 to enable.
+DEBUG = bool(int(os.environ.get("EDMI_DEBUG", "0")))
 
 def main() -> None:
-    t_start = time.perf_counter()
+    t_start = time.perf_counter_ns()
+    out = io.StringIO()
+    _p = out.write
 
-    ser = serial.Serial(
+    cfg = SerialConfig(
         port=PORT,
         baudrate=BAUD,
-        timeout=TIMEOUT_S,
-        write_timeout=TIMEOUT_S,
-        exclusive=True
+        timeout_s=TIMEOUT_S,
+        write_timeout_s=TIMEOUT_S,
+        exclusive=True,
     )
-    transport = SerialTransport(ser=ser)
+    transport = SerialTransport(cfg)
 
     try:
         # regs = (
@@ -52,68 +53,47 @@ def main() -> None:
                 Type=EDMI_TYPE.FLOAT,
                 UnitCode=None,
                 ErrorCode=None,
-                Value=None
+                Value=None,
+                ValueLen=4
             )
         ]
-        wake_up = wake_up_seq()
-        login_packet = edmi_create_login_packet(
-            username="EDMI",
-            password="IMDEIMDE",
-            serial=251308613
-        )
-        read_regs_packet = edmi_create_read_registers_packet(SERIAL_NUMBER, [reg.Address for reg in regs])
-        wlogin_packet = combine_packets(wake_up, login_packet)
 
         transport.connect()
+        session = Session(transport, USERNAME, PASWORD, SERIAL_NUMBER, debug=DEBUG)
 
-        # --- measure write ---
-        t_write_start = time.perf_counter()
-        transport.write_packet(wlogin_packet)
-        print(f"TX <- {bytes_to_hex(wlogin_packet)}")
-        t_write_end = time.perf_counter()
+        # --- measure login ---
+        t_login_start = time.perf_counter_ns()
+        session.login()
+        t_login_end = time.perf_counter_ns()
 
         # --- measure read ---
+        t_read_start = time.perf_counter_ns()
+        payload, parse_err = session.read_registers(regs)
+        t_read_end = time.perf_counter_ns()
+        if DEBUG:
+            _p(f"RX <- {payload.hex(' ')}\n")
+        _p(f"read time  : {(t_read_end - t_read_start) / 1_000_000:.3f} ms\n")
+
+        if parse_err != EDMI_ERROR_CODE.NONE:
+            _p(f"Register parse failed: {parse_err}\n")
+        else:
+            lines = ["Parsed register values:"]
+            for r in regs:
+                if r.ErrorCode == 0x00:
+                    lines.append(f" {r.Name}  0x{r.Address:04X} -> {r.Value}")
+                else:
+                    lines.append(f" {r.Name} 0x{r.Address:04X} -> ERROR 0x{r.ErrorCode:02X}")
+            _p("\n".join(lines) + "\n")
+
+            _p(f"login time : {(t_login_end - t_login_start) / 1_000_000:.3f} ms\n")
 
-        received = transport.read_edmi_packet()
-        payload = edmi_pre_process(received)
-        if EDMI_ERROR_CODE.NONE != edmi_validate_crc(payload):
-            raise Exception("Data corrupted. CRC not match")
-        t_read_end = time.perf_counter()
-        if edmi_parse_login_answer(payload) == EDMI_ERROR_CODE.NONE :
-            t_read_start = time.perf_counter()
-            transport.write_packet((read_regs_packet))
-            print(f"TX <- {bytes_to_hex(read_regs_packet)}")
-            received = transport.read_edmi_packet()
-            t_read_end = time.perf_counter()
-            payload = edmi_pre_process(received)
-            if EDMI_ERROR_CODE.NONE != edmi_validate_crc(payload):
-                raise Exception("Data corrupted. CRC not match")
-            print(f"RX <- {bytes_to_hex(payload)}")
-            print(f"read time  : {(t_read_end - t_read_start) * 1e3:.3f} ms")
-
-            parse_err = edmi_parse_read_registers_answer(payload, regs)
-
-            if parse_err != EDMI_ERROR_CODE.NONE:
-                print(f"Register parse failed: {parse_err}")
-            else:
-                print("Parsed register values:")
-                for r in regs:
-                    if r.ErrorCode == 0x00:
-                        print(f" {r.Name}  0x{r.Address:04X} -> {r.Value}")
-                    else:
-                        print(f" {r.Name} 0x{r.Address:04X} -> ERROR 0x{r.ErrorCode:02X}")
-
-                    print(f"write time : {(t_write_end - t_write_start) * 1e3:.3f} ms")
-
-
-    except Exception as e:
-        raise e
-    
     finally:
-        transport.disconnect()
+        transport.close()
 
-        t_end = time.perf_counter()
-        print(f"total time : {(t_end - t_start) * 1e3:.3f} ms")
+        t_end = time.perf_counter_ns()
+        _p(f"total time : {(t_end - t_start) / 1_000_000:.3f} ms\n")
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
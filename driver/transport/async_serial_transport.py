@@ -0,0 +1,121 @@
+# driver/transport/async_serial_transport.py
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Optional
+
+from driver.transport.serial_transport import SerialTransport
+
+# Readiness on a tty fd needs POSIX; elsewhere the blocking read runs in the
+# loop's default executor instead.
+_SELECTABLE = os.name == "posix"
+
+# How soon read_edmi_packet looks again when another thread holds the port.
+_BUSY_RETRY_S = 0.001
+
+
+class AsyncSerialTransport:
+    """
+    asyncio front end for a connected SerialTransport.
+
+    EDMI reads register the tty fd with the event loop (epoll on Linux) and
+    assemble the frame from whatever the driver has queued each time the fd
+    turns readable, so one loop thread can serve many ports without a
+    blocked thread per read.
+    """
+
+    def __init__(self, transport: SerialTransport) -> None:
+        self.transport = transport
+
+    async def write_packet(self, payload: bytes) -> None:
+        # ser.write() blocks until the driver accepts the bytes (up to the
+        # write timeout) and can wait on _io_lock, so keep it off the loop.
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.transport.write_packet, payload)
+
+    async def write_packets(self, *packets: bytes) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.transport.write_packets, *packets)
+
+    async def read_edmi_packet(self, timeout_s: Optional[float] = None) -> bytes:
+        """
+        Read one STX..ETX frame. timeout_s defaults to the transport's
+        configured read timeout; raises TimeoutError when it runs out.
+        """
+        transport = self.transport
+        if timeout_s is None:
+            timeout_s = transport.timeout_s
+
+        loop = asyncio.get_running_loop()
+        if not _SELECTABLE:
+            # A pipelined reply may already be complete in the rx buffer.
+            try:
+                frame = transport.try_poll_edmi_packet()
+            except BlockingIOError:
+                frame = None
+            if frame is not None:
+                return frame
+
+            # Timing out here does not stop the executor thread, which keeps
+            # blocking in read_edmi_packet while holding _io_lock. Cancel the
+            # pending read so it returns and releases the transport.
+            read = loop.run_in_executor(None, lambda: transport.read_edmi_packet().tobytes())
+            try:
+                return await self._wait(read, timeout_s)
+            except TimeoutError:
+                transport.cancel_read()
+                raise
+
+        fd = transport.fileno()
+        done: asyncio.Future[bytes] = loop.create_future()
+        retry: Optional[asyncio.TimerHandle] = None
+
+        def on_readable() -> None:
+            nonlocal retry
+            if done.done():
+                return
+            try:
+                frame = transport.try_poll_edmi_packet()
+            except BlockingIOError:
+                # An executor thread holds the port (e.g. writing). Stop
+                # watching the fd, which would only fire again at once, and
+                # look again shortly instead of blocking the loop on the lock.
+                loop.remove_reader(fd)
+                if retry is None:
+                    retry = loop.call_later(_BUSY_RETRY_S, on_retry)
+                return
+            except Exception as e:
+                done.set_exception(e)
+                return
+            if frame is not None:
+                done.set_result(frame)
+
+        def on_retry() -> None:
+            nonlocal retry
+            retry = None
+            if done.done():
+                return
+            loop.add_reader(fd, on_readable)
+            on_readable()
+
+        loop.add_reader(fd, on_readable)
+        try:
+            # A pipelined reply may already be complete in the rx buffer.
+            on_readable()
+            return await self._wait(done, timeout_s)
+        finally:
+            loop.remove_reader(fd)
+            if retry is not None:
+                retry.cancel()
+
+    async def read_tvl_packet(self) -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.transport.read_tvl_packet)
+
+    @staticmethod
+    async def _wait(fut: asyncio.Future[bytes], timeout_s: float) -> bytes:
+        try:
+            return await asyncio.wait_for(fut, timeout_s)
+        except asyncio.TimeoutError:
+            raise TimeoutError("serial read timeout") from None
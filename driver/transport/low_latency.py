@@ -0,0 +1,64 @@
+# driver/transport/low_latency.py
+from __future__ import annotations
+
+import logging
+import os
+import sys
+
+import serial
+
+log = logging.getLogger(__name__)
+
+# <linux/serial.h>
+TIOCGSERIAL = 0x541E
+TIOCSSERIAL = 0x541F
+ASYNC_LOW_LATENCY = 1 << 13
+_SERIAL_STRUCT_FLAGS = 4  # index of `flags` in struct serial_struct (ints)
+
+# FTDI-style USB adapters batch RX bytes for latency_timer ms (default 16).
+_USB_SERIAL_SYSFS = "/sys/bus/usb-serial/devices/{name}/latency_timer"
+LATENCY_TIMER_MS = 1
+
+
+def enable_low_latency(ser: serial.Serial) -> bool:
+    """
+    Best-effort: make the OS hand received bytes to us immediately.
+
+    On Linux this sets ASYNC_LOW_LATENCY on the tty and, for USB-serial
+    adapters, lowers the sysfs latency_timer to LATENCY_TIMER_MS. Returns
+    True if either took effect; never raises. Other platforms are left as is.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    return _set_async_low_latency(ser) | _set_latency_timer(ser)
+
+
+def _set_async_low_latency(ser: serial.Serial) -> bool:
+    try:
+        import array
+        import fcntl
+
+        buf = array.array("i", [0] * 64)
+        fcntl.ioctl(ser.fileno(), TIOCGSERIAL, buf)
+        buf[_SERIAL_STRUCT_FLAGS] |= ASYNC_LOW_LATENCY
+        fcntl.ioctl(ser.fileno(), TIOCSSERIAL, buf)
+        return True
+    except (OSError, ValueError, AttributeError) as e:
+        log.debug("ASYNC_LOW_LATENCY not set on %s: %s", getattr(ser, "port", "?"), e)
+        return False
+
+
+def _set_latency_timer(ser: serial.Serial) -> bool:
+    port = getattr(ser, "port", None)
+    if not port:
+        return False
+    # Resolve udev symlinks (/dev/serial/by-id/...) to the ttyUSBn name.
+    name = os.path.basename(os.path.realpath(port))
+    path = _USB_SERIAL_SYSFS.format(name=name)
+    try:
+        with open(path, "w") as f:
+            f.write(str(LATENCY_TIMER_MS))
+        return True
+    except OSError as e:
+        log.debug("latency_timer not set for %s: %s", name, e)
+        return False
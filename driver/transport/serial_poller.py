@@ -0,0 +1,144 @@
+# driver/transport/serial_poller.py
+from __future__ import annotations
+
+import os
+import selectors
+import time
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from driver.transport.serial_transport import SerialTransport
+
+# pyserial only exposes a pollable fd on POSIX; elsewhere fall back to
+# reading each transport in turn with its blocking read.
+_SELECTABLE = os.name == "posix"
+
+
+class SerialReactor:
+    """
+    One selector shared by many SerialTransports, driven by a single thread.
+
+    Callers write their requests, announce the reply they expect per port
+    with expect_edmi()/expect_tvl(), then iterate run() to get the replies
+    in arrival order. The selector (one epoll fd on Linux) lives as long as
+    the reactor, so repeated polling rounds do not rebuild it.
+
+    A port is only registered while a reply is expected; bytes that arrive
+    outside a round stay queued in the driver until the next one.
+    """
+
+    def __init__(self) -> None:
+        self._sel: Optional[selectors.BaseSelector] = (
+            selectors.DefaultSelector() if _SELECTABLE else None
+        )
+        # transport -> (non-blocking poll, blocking fallback read, fd)
+        self._expected: Dict[
+            SerialTransport,
+            Tuple[Callable[[], Optional[bytes]], Callable[[], bytes], int],
+        ] = {}
+
+    def expect_edmi(self, transport: SerialTransport) -> None:
+        self._expect(
+            transport,
+            transport.poll_edmi_packet,
+            lambda: transport.read_edmi_packet().tobytes(),
+        )
+
+    def expect_tvl(self, transport: SerialTransport) -> None:
+        self._expect(transport, transport.poll_tvl_packet, transport.read_tvl_packet)
+
+    def run(self, timeout_s: float) -> Iterator[Tuple[SerialTransport, bytes]]:
+        """
+        Yield (transport, frame) for every expected reply as it completes.
+        Raises TimeoutError if some replies are still missing after timeout_s.
+
+        Without a selector (non-POSIX) the ports are read one after another
+        with their blocking reads. No new read starts after timeout_s, but
+        the read in progress can still run for up to its port's own timeout.
+        """
+        sel = self._sel
+        if sel is None:
+            deadline = time.monotonic() + timeout_s
+            while self._expected:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError("serial read timeout")
+                transport, (_, read, _) = self._expected.popitem()
+                yield transport, read()
+            return
+
+        # A pipelined reply may already be complete in the rx buffer.
+        for transport, (poll, _, _) in list(self._expected.items()):
+            frame = poll()
+            if frame is not None:
+                self._done(transport)
+                yield transport, frame
+
+        deadline = time.monotonic() + timeout_s
+        while self._expected:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("serial read timeout")
+
+            for key, _ in sel.select(remaining):
+                transport = key.data
+                entry = self._expected.get(transport)
+                if entry is None:
+                    continue
+                frame = entry[0]()
+                if frame is not None:
+                    self._done(transport)
+                    yield transport, frame
+
+    def cancel(self) -> None:
+        """Forget every outstanding expectation (e.g. after a timeout)."""
+        for transport in list(self._expected):
+            self._done(transport)
+
+    def close(self) -> None:
+        self.cancel()
+        if self._sel is not None:
+            self._sel.close()
+            self._sel = None
+
+    def __enter__(self) -> "SerialReactor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _expect(
+        self,
+        transport: SerialTransport,
+        poll: Callable[[], Optional[bytes]],
+        read: Callable[[], bytes],
+    ) -> None:
+        if transport in self._expected:
+            raise ValueError("a reply is already expected on this transport")
+        fd = -1
+        if self._sel is not None:
+            fd = transport.fileno()
+            self._sel.register(fd, selectors.EVENT_READ, transport)
+        self._expected[transport] = (poll, read, fd)
+
+    def _done(self, transport: SerialTransport) -> None:
+        _, _, fd = self._expected.pop(transport)
+        if self._sel is not None:
+            self._sel.unregister(fd)
+
+
+def poll_all(
+    transports: Iterable[SerialTransport],
+    timeout_s: float,
+) -> Iterator[Tuple[SerialTransport, bytes]]:
+    """
+    Wait for one EDMI reply from each transport and yield (transport, frame)
+    in arrival order, so the first meter to answer is handled first.
+
+    The requests must already have been written. One thread waits on every
+    port through a single selector instead of one blocked thread per port.
+    Raises TimeoutError if some replies are still missing after timeout_s
+    (see SerialReactor.run for the non-POSIX fallback).
+    """
+    with SerialReactor() as reactor:
+        for transport in transports:
+            reactor.expect_edmi(transport)
+        yield from reactor.run(timeout_s)
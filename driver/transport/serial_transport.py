@@ -5,20 +5,34 @@ import logging
 import struct
 import threading
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 import serial
 
 from driver.edmi_enums import EDMI_DLE_IDEN, EDMI_ETX_IDEN, EDMI_STX_IDEN
 from driver.serial_settings import MAX_PACKET_LENGTH
+from driver.transport.low_latency import enable_low_latency
 
 log = logging.getLogger(__name__)
 
+# Receive buffer for one stuffed EDMI frame, allocated once per transport.
+# Sized to the protocol's frame limit, so a frame never outgrows it.
+_RX_BUFFER_SIZE = MAX_PACKET_LENGTH + 1
+
+_ETX_BYTE = bytes((EDMI_ETX_IDEN,))
+
+# TVL length header: big-endian u16.
+_TVL_LEN = struct.Struct(">H")
+
 
 class SerialNotReadyError(ConnectionError):
     """Raised when serial is not connected/ready."""
 
 
+class EDMIFramingError(OSError):
+    """Raised when an EDMI frame outgrows the receive buffer."""
+
+
 @dataclass(frozen=True)
 class SerialConfig:
     port: str
@@ -35,12 +49,25 @@ class SerialTransport:
     - Owns pyserial.Serial lifecycle.
     - Provides TVL and EDMI framed reads.
     - Single in-flight I/O guarded by a threading.Lock.
+    - exchange_lock serializes whole request/reply exchanges.
     """
 
     def __init__(self, cfg: SerialConfig) -> None:
         self._cfg = cfg
         self._ser: Optional[serial.Serial] = None
         self._io_lock = threading.Lock()
+        # Held by callers around one request/reply exchange (write + read).
+        # flush_input takes it as well, so a flush never lands between the
+        # request and its reply.
+        self.exchange_lock = threading.Lock()
+        # Bytes received after the last returned EDMI frame. With pipelined
+        # requests these are the start of the next reply.
+        self._rx_pending = bytearray()
+        # Where poll_edmi_packet resumes its ETX scan in _rx_pending, so a
+        # frame trickling in over many polls is scanned only once.
+        self._rx_scan_from = 1
+        self._rx_buf = bytearray(_RX_BUFFER_SIZE)
+        self._rx_mv = memoryview(self._rx_buf)
 
     # ----------------------------
     # Lifecycle
@@ -56,10 +83,13 @@ class SerialTransport:
             write_timeout=self._cfg.write_timeout_s,
             exclusive=self._cfg.exclusive,
         )
+        enable_low_latency(self._ser)
 
     def close(self) -> None:
         ser = self._ser
         self._ser = None
+        self._rx_pending.clear()
+        self._rx_scan_from = 1
         if ser is None:
             return
         try:
@@ -70,12 +100,28 @@ class SerialTransport:
     def is_ready(self) -> bool:
         return bool(self._ser is not None and getattr(self._ser, "is_open", False))
 
+    @property
+    def timeout_s(self) -> float:
+        return self._cfg.timeout_s
+
     # ----------------------------
     # Public I/O
     # ----------------------------
 
     def write_packet(self, payload: bytes) -> None:
         self._validate_payload(payload)
+        self._write(payload)
+
+    def write_packets(self, *packets: bytes) -> None:
+        """
+        Send several frames with a single ser.write(), so a USB/VCP adapter
+        sees one bulk transfer instead of one per frame.
+        """
+        for packet in packets:
+            self._validate_payload(packet)
+        self._write(b"".join(packets))
+
+    def _write(self, payload: bytes) -> None:
         with self._io_lock:
             ser = self._get_ready_serial()
             try:
@@ -92,7 +138,7 @@ class SerialTransport:
             ser = self._get_ready_serial()
             try:
                 header = self._read_exact(ser, 2)
-                (length,) = struct.unpack(">H", header)
+                length = _TVL_LEN.unpack_from(header)[0]
                 if length == 0:
                     return b""
                 return self._read_exact(ser, length)
@@ -102,20 +148,103 @@ class SerialTransport:
                 self.close()
                 raise OSError("serial read failed") from e
 
-    def read_edmi_packet(self) -> bytes:
+    def read_edmi_packet(self) -> memoryview:
+        """
+        Read one STX..ETX frame.
+
+        Returns a view into the transport's receive buffer; it is only valid
+        until the next read, so de-stuff it (edmi_pre_process) or call
+        .tobytes() before reading again.
+        """
         with self._io_lock:
             ser = self._get_ready_serial()
             try:
-                return self._read_edmi_packet_sync(ser)
+                return self._read_edmi_packet_into(ser)
             except TimeoutError:
                 raise
+            except EDMIFramingError:
+                self._drop_oversized_frame(ser)
+                raise
             except (serial.SerialException, OSError) as e:
                 self.close()
                 raise OSError("serial read failed") from e
 
-    def flush_input(self) -> None:
+    def poll_edmi_packet(self) -> Optional[bytes]:
+        """
+        Non-blocking read: pull whatever the driver has queued and return
+        one complete STX..ETX frame, or None if it has not fully arrived.
+        Meant to be called when the fd is readable (see serial_poller).
+        """
+        with self._io_lock:
+            return self._poll_edmi_locked()
+
+    def try_poll_edmi_packet(self) -> Optional[bytes]:
+        """
+        poll_edmi_packet for an event-loop thread: raises BlockingIOError
+        instead of waiting when another thread holds the I/O lock (e.g. a
+        write in progress), so the loop never blocks on it.
+        """
+        if not self._io_lock.acquire(blocking=False):
+            raise BlockingIOError("serial port busy")
+        try:
+            return self._poll_edmi_locked()
+        finally:
+            self._io_lock.release()
+
+    def _poll_edmi_locked(self) -> Optional[bytes]:
+        self._pull_pending()
+        frame, self._rx_scan_from = self._take_edmi_frame(
+            self._rx_pending, self._rx_scan_from
+        )
+        # Same cap as the blocking read: an STX that never sees its ETX
+        # must not grow _rx_pending for as long as bytes keep arriving.
+        if frame is None and len(self._rx_pending) > _RX_BUFFER_SIZE:
+            self._drop_oversized_frame(self._get_ready_serial())
+            raise EDMIFramingError("EDMI frame larger than receive buffer")
+        return frame
+
+    def _drop_oversized_frame(self, ser: serial.Serial) -> None:
+        # Drop the partial frame and whatever follows it, so the next read
+        # starts clean instead of inside the same frame.
+        log.warning("Oversized EDMI frame dropped; flushing input")
+        self._rx_pending.clear()
+        self._rx_scan_from = 1
+        try:
+            ser.reset_input_buffer()
+        except (serial.SerialException, OSError):
+            self.close()
+
+    def poll_tvl_packet(self) -> Optional[bytes]:
+        """
+        Non-blocking counterpart of read_tvl_packet: return one complete
+        TVL body once its header and all `length` bytes are queued, else None.
+        """
         with self._io_lock:
+            self._pull_pending()
+            self._rx_scan_from = 1
+            return self._take_tvl_frame(self._rx_pending)
+
+    def cancel_read(self) -> None:
+        """
+        Make a read blocked in another thread return early (it then raises
+        TimeoutError). Does not take _io_lock, which that read is holding.
+        """
+        ser = self._ser
+        if ser is None:
+            return
+        try:
+            ser.cancel_read()
+        except (AttributeError, serial.SerialException, OSError):
+            pass
+
+    def fileno(self) -> int:
+        return self._get_ready_serial().fileno()
+
+    def flush_input(self) -> None:
+        with self.exchange_lock, self._io_lock:
             ser = self._get_ready_serial()
+            self._rx_pending.clear()
+            self._rx_scan_from = 1
             try:
                 ser.reset_input_buffer()
             except (serial.SerialException, OSError):
@@ -143,41 +272,133 @@ class SerialTransport:
         mv = memoryview(buf)
         read = 0
 
+        # pyserial's readinto() is read() plus a copy into `mv`, so this saves
+        # no copy over read(); it only keeps the short-read loop simple.
         while read < n:
             try:
-                chunk = ser.read(n - read)
+                got = ser.readinto(mv[read:])
             except (serial.SerialException, OSError) as e:
                 raise OSError("serial read failed") from e
 
-            if not chunk:
+            if not got:
                 raise TimeoutError("serial read timeout")
 
-            mv[read : read + len(chunk)] = chunk
-            read += len(chunk)
+            read += got
 
         return bytes(buf)
 
+    def _pull_pending(self) -> None:
+        ser = self._get_ready_serial()
+        try:
+            n = ser.in_waiting
+            if n:
+                self._rx_pending.extend(ser.read(n))
+        except (serial.SerialException, OSError) as e:
+            self.close()
+            raise OSError("serial read failed") from e
+
     @staticmethod
-    def _read_edmi_packet_sync(ser: serial.Serial) -> bytes:
-        buf = bytearray()
-        in_frame = False
+    def _take_tvl_frame(pending: bytearray) -> Optional[bytes]:
+        """Remove and return the first complete TVL body in `pending`, if any."""
+        if len(pending) < _TVL_LEN.size:
+            return None
+        end = _TVL_LEN.size + _TVL_LEN.unpack_from(pending)[0]
+        if len(pending) < end:
+            return None
+        body = bytes(pending[_TVL_LEN.size : end])
+        del pending[:end]
+        return body
 
-        while True:
-            n = getattr(ser, "in_waiting", 0)
-            chunk = ser.read(n if n > 0 else 1)
+    @staticmethod
+    def _take_edmi_frame(
+        pending: bytearray, scan_from: int = 1
+    ) -> Tuple[Optional[bytes], int]:
+        """
+        Remove and return the first complete frame in `pending`, if any,
+        with the offset to resume the ETX scan from on the next call.
+        """
+        start = pending.find(EDMI_STX_IDEN)
+        if start < 0:
+            pending.clear()
+            return None, 1
+        if start:
+            del pending[:start]
+            scan_from = 1
+
+        i = pending.find(_ETX_BYTE, max(scan_from, 1))
+        while i > 0:
+            if pending[i - 1] != EDMI_DLE_IDEN:
+                frame = bytes(pending[: i + 1])
+                del pending[: i + 1]
+                return frame, 1
+            i = pending.find(_ETX_BYTE, i + 1)
+        return None, max(len(pending), 1)
+
+    def _read_edmi_packet_into(self, ser: serial.Serial) -> memoryview:
+        """
+        Fill the receive buffer with readinto() until an unescaped ETX.
+
+        Bytes left over from the previous call (`_rx_pending`) are consumed
+        first; whatever follows this frame's ETX is saved there again.
+
+        pyserial's readinto() still builds a bytes object and copies it into
+        the buffer; the saving is the one reused buffer and returning a view
+        of it instead of a new bytes per frame.
+        """
+        buf = self._rx_buf
+        mv = self._rx_mv
+        size = len(buf)
+        pending = self._rx_pending
+
+        n = len(pending)
+        if n > size:
+            raise EDMIFramingError("EDMI frame larger than receive buffer")
+        if n:
+            mv[:n] = pending
+            pending.clear()
+        self._rx_scan_from = 1
 
-            if not chunk:
-                raise TimeoutError("serial read timeout")
+        in_frame = False
+        scan_from = 1
 
+        while True:
             if not in_frame:
-                pos = chunk.find(bytes((EDMI_STX_IDEN,)))
+                pos = buf.find(EDMI_STX_IDEN, 0, n)
                 if pos < 0:
-                    continue
-                in_frame = True
-                buf.extend(chunk[pos:])
+                    n = 0
+                else:
+                    if pos:
+                        buf[: n - pos] = buf[pos:n]
+                        n -= pos
+                    in_frame = True
+
+            if in_frame:
+                # find() scans in C; Python only looks at each ETX hit.
+                i = buf.find(_ETX_BYTE, scan_from, n)
+                while i >= 0:
+                    if buf[i - 1] != EDMI_DLE_IDEN:
+                        if i + 1 < n:
+                            pending.extend(mv[i + 1 : n])
+                        return mv[: i + 1]
+                    i = buf.find(_ETX_BYTE, i + 1, n)
+                scan_from = max(n, 1)
+
+            if n >= size:
+                raise EDMIFramingError("EDMI frame larger than receive buffer")
+
+            # Take everything the driver already holds. When it holds nothing,
+            # block for one byte only (a larger fixed read would sit out the
+            # whole timeout on a short frame tail), then pick up whatever
+            # arrived alongside it before scanning again.
+            avail = ser.in_waiting
+            if avail:
+                got = ser.readinto(mv[n : n + min(avail, size - n)])
             else:
-                buf.extend(chunk)
-
-            for i in range(1, len(buf)):
-                if buf[i] == EDMI_ETX_IDEN and buf[i - 1] != EDMI_DLE_IDEN:
-                    return bytes(buf[: i + 1])
+                got = ser.readinto(mv[n : n + 1])
+                if got and n + 1 < size:
+                    avail = ser.in_waiting
+                    if avail:
+                        got += ser.readinto(mv[n + 1 : n + 1 + min(avail, size - n - 1)])
+            if not got:
+                raise TimeoutError("serial read timeout")
+            n += got
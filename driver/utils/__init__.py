@@ -0,0 +1,34 @@
+
+from __future__ import annotations
+
+from typing import Union
+
+# Profile formatting lives in driver.utils.formatter; re-exported here for
+# callers that import it from driver.utils.
+from driver.utils.formatter import edmi_read_profile_formatter, format_parsed_profile_data
+
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def combine_packets(*packets: BytesLike) -> bytes:
+    """
+    Combine multiple packets into one contiguous bytes stream.
+
+    bytes.join sizes the result once and copies each packet exactly once;
+    it accepts bytes/bytearray/memoryview directly.
+    """
+    return b"".join(packets)
+
+def bytes_to_hex(data: BytesLike) -> str:
+    # bytes, bytearray and memoryview all format in C with a separator.
+    return data.hex(" ")
+
+def as_bytes(x: Union[str, BytesLike], encoding: str = "ascii") -> memoryview:
+    if isinstance(x, memoryview):
+        return x
+    if isinstance(x, (bytes, bytearray)):
+        return memoryview(x)
+    if isinstance(x, str):
+        return memoryview(x.encode(encoding))
+    raise TypeError(f"expected str or bytes-like, received {type(x).__name__}")
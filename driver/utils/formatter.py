@@ -1,38 +1,53 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 import struct
-from typing import Any
+from typing import Any, Callable
 
 from driver.edmi_enums import EDMI_TYPE
 from driver.interface.edmi_structs import EDMIDateTime,\
       EDMIFileField, EDMIProfileSpec, EDMISurvey
 
+# Reinterpret a float as its IEEE-754 bit pattern (DOUBLE_ENERGY read as a
+# double) without re-parsing the format string on every value.
+_PACK_F64_BE = struct.Struct(">d").pack
+_UNPACK_U64_BE = struct.Struct(">Q").unpack
 
-def _edmi_datetime_to_datetime(dt: EDMIDateTime | None) -> datetime | None:
-    if dt is None or dt.IsNull:
-        return None
-    year = dt.Year
+
+# EDMIDateTime is a mutable dataclass (not hashable), so conversions are
+# cached on its field values. Profiles repeat the same timestamps a lot and
+# datetime/str results are immutable, so sharing them is safe.
+@lru_cache(maxsize=4096)
+def _mk_dt(year: int, month: int, day: int, hour: int, minute: int, second: int) -> datetime:
     if year < 100:
         year += 2000
-    return datetime(year, dt.Month, dt.Day, dt.Hour, dt.Minute, dt.Second)
+    return datetime(year, month, day, hour, minute, second)
 
 
-def _format_edmi_datetime(dt: EDMIDateTime | None) -> str | None:
+@lru_cache(maxsize=4096)
+def _format_dt_fields(
+    year: int, month: int, day: int, hour: int, minute: int, second: int
+) -> str:
+    if year == 0 and month == 0 and day == 0:
+        return f"{hour:02d}:{minute:02d}:{second:02d}"
+    return _mk_dt(year, month, day, hour, minute, second).isoformat(sep=" ")
+
+
+def _to_py_dt(dt: EDMIDateTime | None) -> datetime | None:
     if dt is None or dt.IsNull:
         return None
-    if dt.Year == 0 and dt.Month == 0 and dt.Day == 0:
-        return f"{dt.Hour:02d}:{dt.Minute:02d}:{dt.Second:02d}"
-    py_dt = _edmi_datetime_to_datetime(dt)
-    if py_dt is None:
-        return None
-    return py_dt.isoformat(sep=" ")
+    return _mk_dt(dt.Year, dt.Month, dt.Day, dt.Hour, dt.Minute, dt.Second)
 
 
-def _format_edmi_date(dt: EDMIDateTime | None) -> str | None:
+def _format_edmi_datetime(dt: EDMIDateTime | None) -> str | None:
     if dt is None or dt.IsNull:
         return None
-    py_dt = _edmi_datetime_to_datetime(dt)
+    return _format_dt_fields(dt.Year, dt.Month, dt.Day, dt.Hour, dt.Minute, dt.Second)
+
+
+def _format_edmi_date(dt: EDMIDateTime | None) -> str | None:
+    py_dt = _to_py_dt(dt)
     if py_dt is None:
         return None
     return py_dt.date().isoformat()
@@ -53,45 +68,140 @@ def _scaled_value(value: Any, factor: float | None) -> Any:
         return value
 
 
+def _format_float_energy(raw: Any, scaling_factor: float | None) -> Any:
+    return _scaled_value(int(raw) & 0xFFFFFFFF, scaling_factor)
+
+
+def _format_double_energy(raw: Any, scaling_factor: float | None) -> Any:
+    if isinstance(raw, float):
+        value_u64 = _UNPACK_U64_BE(_PACK_F64_BE(raw))[0]
+        return _scaled_value(value_u64, scaling_factor)
+    value_u64 = int(raw) & 0xFFFFFFFFFFFFFFFF
+    return _scaled_value(value_u64, scaling_factor)
+
+
+def _format_raw(raw: Any, scaling_factor: float | None) -> Any:
+    return raw
+
+
+def _format_scaled(raw: Any, scaling_factor: float | None) -> Any:
+    return _scaled_value(raw, scaling_factor)
+
+
+def _format_scaled_int(raw: Any, scaling_factor: float | None) -> Any:
+    return _scaled_value(int(raw), scaling_factor)
+
+
+# One handler per channel type, so formatting a value is a single dict lookup
+# rather than a walk down an if/elif ladder. Types not listed pass through.
+_CHANNEL_FORMATTERS: dict[EDMI_TYPE, Callable[[Any, float | None], Any]] = {
+    EDMI_TYPE.BOOLEAN: lambda raw, scaling_factor: bool(raw),
+    EDMI_TYPE.BYTE: lambda raw, scaling_factor: int(raw),
+    EDMI_TYPE.STRING: _format_raw,
+    EDMI_TYPE.STRING_LONG: _format_raw,
+    EDMI_TYPE.EFA_STRING: _format_raw,
+    EDMI_TYPE.ERROR_STRING: _format_raw,
+    EDMI_TYPE.DATE_TIME: lambda raw, scaling_factor: _format_edmi_datetime(raw),
+    EDMI_TYPE.DATE: lambda raw, scaling_factor: _format_edmi_date(raw),
+    EDMI_TYPE.TIME: lambda raw, scaling_factor: _format_edmi_time(raw),
+    EDMI_TYPE.FLOAT_ENERGY: _format_float_energy,
+    EDMI_TYPE.DOUBLE_ENERGY: _format_double_energy,
+    EDMI_TYPE.FLOAT: _format_scaled,
+    EDMI_TYPE.POWER_FACTOR: _format_scaled,
+    EDMI_TYPE.DOUBLE: _format_scaled,
+    EDMI_TYPE.SHORT: _format_scaled_int,
+    EDMI_TYPE.HEX_SHORT: _format_scaled_int,
+    EDMI_TYPE.LONG: _format_scaled_int,
+    EDMI_TYPE.HEX_LONG: _format_scaled_int,
+    EDMI_TYPE.REGISTER_NUMBER_HEX_LONG: _format_scaled_int,
+    EDMI_TYPE.LONG_LONG: _format_scaled_int,
+}
+
+
 def _format_channel_value(raw: Any, vtype: EDMI_TYPE, scaling_factor: float | None) -> Any:
     if raw is None:
         return None
+    handler = _CHANNEL_FORMATTERS.get(vtype)
+    if handler is None:
+        return raw
+    return handler(raw, scaling_factor)
 
-    if vtype == EDMI_TYPE.BOOLEAN:
-        return bool(raw)
+
+# Raw channel type -> EDMI_TYPE without the enum constructor's ValueError
+# path; unknown types map to None.
+_TYPE_MAP = EDMI_TYPE._value2member_map_
+
+# How format_parsed_profile_data handles a channel inline; anything else goes
+# through _format_channel_value.
+_RAW, _SCALE, _INT, _INT_SCALE, _GENERIC = range(5)
+_FLOAT_TYPES = frozenset((EDMI_TYPE.FLOAT, EDMI_TYPE.POWER_FACTOR, EDMI_TYPE.DOUBLE))
+_INT_TYPES = frozenset((
+    EDMI_TYPE.SHORT,
+    EDMI_TYPE.HEX_SHORT,
+    EDMI_TYPE.LONG,
+    EDMI_TYPE.HEX_LONG,
+    EDMI_TYPE.REGISTER_NUMBER_HEX_LONG,
+    EDMI_TYPE.LONG_LONG,
+))
+_RAW_TYPES = frozenset((
+    EDMI_TYPE.STRING,
+    EDMI_TYPE.STRING_LONG,
+    EDMI_TYPE.EFA_STRING,
+    EDMI_TYPE.ERROR_STRING,
+))
+
+
+def _channel_kind(vtype: EDMI_TYPE | None, scaling: float | None) -> int:
+    if vtype is None or vtype in _RAW_TYPES:
+        return _RAW
+    if vtype in _FLOAT_TYPES:
+        return _RAW if scaling is None else _SCALE
+    if vtype in _INT_TYPES:
+        return _INT if scaling is None else _INT_SCALE
     if vtype == EDMI_TYPE.BYTE:
-        return int(raw)
-    if vtype in (EDMI_TYPE.STRING, EDMI_TYPE.STRING_LONG, EDMI_TYPE.EFA_STRING, EDMI_TYPE.ERROR_STRING):
-        return raw
-    if vtype == EDMI_TYPE.DATE_TIME:
-        return _format_edmi_datetime(raw)
-    if vtype == EDMI_TYPE.DATE:
-        return _format_edmi_date(raw)
-    if vtype == EDMI_TYPE.TIME:
-        return _format_edmi_time(raw)
-    if vtype == EDMI_TYPE.FLOAT_ENERGY:
-        value_u32 = int(raw) & 0xFFFFFFFF
-        return _scaled_value(value_u32, scaling_factor)
-    if vtype == EDMI_TYPE.DOUBLE_ENERGY:
-        if isinstance(raw, float):
-            packed = struct.pack(">d", raw)
-            value_u64 = struct.unpack(">Q", packed)[0]
-            return _scaled_value(value_u64, scaling_factor)
-        value_u64 = int(raw) & 0xFFFFFFFFFFFFFFFF
-        return _scaled_value(value_u64, scaling_factor)
-    if vtype in (EDMI_TYPE.FLOAT, EDMI_TYPE.POWER_FACTOR, EDMI_TYPE.DOUBLE):
-        return _scaled_value(raw, scaling_factor)
-    if vtype in (
-        EDMI_TYPE.SHORT,
-        EDMI_TYPE.HEX_SHORT,
-        EDMI_TYPE.LONG,
-        EDMI_TYPE.HEX_LONG,
-        EDMI_TYPE.REGISTER_NUMBER_HEX_LONG,
-        EDMI_TYPE.LONG_LONG,
-    ):
-        return _scaled_value(int(raw), scaling_factor)
+        return _INT
+    return _GENERIC
 
-    return raw
+
+def _record_timestamps(
+    start_dt: datetime | None,
+    interval_sec: int | float,
+    count: int,
+) -> list[str | None]:
+    """
+    "YYYY-MM-DD HH:MM:SS" for each record, one interval apart.
+
+    With a whole-second interval the date prefix is formatted once per day
+    and only the time of day is rebuilt per record from integer seconds;
+    otherwise a datetime is advanced and isoformat()ed per record.
+    """
+    if start_dt is None:
+        return [None] * count
+    if interval_sec <= 0:
+        return [start_dt.isoformat(sep=" ")] * count
+
+    timestamps: list[str | None] = []
+    if not isinstance(interval_sec, int) or start_dt.microsecond:
+        step = timedelta(seconds=interval_sec)
+        cur_dt = start_dt
+        for _ in range(count):
+            timestamps.append(cur_dt.isoformat(sep=" "))
+            cur_dt += step
+        return timestamps
+
+    day = start_dt.date()
+    prefix = f"{day.isoformat()} "
+    sec_of_day = start_dt.hour * 3600 + start_dt.minute * 60 + start_dt.second
+    for _ in range(count):
+        if sec_of_day >= 86400:
+            days, sec_of_day = divmod(sec_of_day, 86400)
+            day += timedelta(days=days)
+            prefix = f"{day.isoformat()} "
+        hour, rem = divmod(sec_of_day, 3600)
+        minute, second = divmod(rem, 60)
+        timestamps.append(f"{prefix}{hour:02d}:{minute:02d}:{second:02d}")
+        sec_of_day += interval_sec
+    return timestamps
 
 
 def format_parsed_profile_data(
@@ -103,42 +213,56 @@ def format_parsed_profile_data(
         return []
 
     records_count = profile_spec.RecordsCount or (len(fields) // channels_count)
-    start_dt = _edmi_datetime_to_datetime(profile_spec.FromDateTime)
+    start_dt = _to_py_dt(profile_spec.FromDateTime)
     interval_sec = profile_spec.Interval
     base_record = getattr(profile_spec, "StartRecord", 0)
 
+    # Channel name, type and effective scaling are the same for every record.
+    channel_plan: list[tuple[str, EDMI_TYPE | None, float | None, int]] = []
+    for ch in range(channels_count):
+        ch_info = profile_spec.ChannelsInfo[ch]
+        vtype = _TYPE_MAP.get(ch_info.Type)
+        scaling = getattr(ch_info, "ScalingFactor", None)
+        if profile_spec.Survey == EDMISurvey.LS03 and scaling is not None:
+            scaling *= 0.001344
+        channel_plan.append((ch_info.Name, vtype, scaling, _channel_kind(vtype, scaling)))
+
+    needed = records_count * channels_count
+    if len(fields) < needed:
+        raise IndexError(f"expected {needed} profile fields, got {len(fields)}")
+
+    # Fields are record-major; format one channel column at a time so each
+    # column is a single comprehension with its conversion chosen once.
+    # Plain and scaled numbers are nearly every value in a profile.
+    names = [plan[0] for plan in channel_plan]
+    columns: list[list[Any]] = []
+    for ch, (name, vtype, scaling, kind) in enumerate(channel_plan):
+        raws = [field.Value for field in fields[ch:needed:channels_count]]
+        column = None
+        try:
+            if kind == _RAW:
+                column = raws
+            elif kind == _SCALE:
+                column = [None if raw is None else raw * scaling for raw in raws]
+            elif kind == _INT:
+                column = [None if raw is None else int(raw) for raw in raws]
+            elif kind == _INT_SCALE:
+                column = [None if raw is None else int(raw) * scaling for raw in raws]
+        except (TypeError, ValueError):
+            # An odd value in the column: let the per-value formatter decide
+            # (e.g. _scaled_value passes non-numbers through).
+            column = None
+        if column is None:
+            column = [_format_channel_value(raw, vtype, scaling) for raw in raws]
+        columns.append(column)
+
     records: list[dict[str, Any]] = []
-    idx = 0
-    for record_idx in range(records_count):
+    timestamps = _record_timestamps(start_dt, interval_sec, records_count)
+    for record_idx, (timestamp, values) in enumerate(zip(timestamps, zip(*columns))):
         item: dict[str, Any] = {}
         item["record_number"] = base_record + record_idx
-        if start_dt is None:
-            item["timestamp"] = None
-        elif interval_sec > 0:
-            item["timestamp"] = (start_dt + timedelta(seconds=interval_sec * record_idx)).isoformat(sep=" ")
-        else:
-            item["timestamp"] = start_dt.isoformat(sep=" ")
-
-        for ch in range(channels_count):
-            field = fields[idx]
-            idx += 1
-            ch_info = profile_spec.ChannelsInfo[ch]
-            try:
-                vtype = EDMI_TYPE(ch_info.Type)
-            except ValueError:
-                vtype = None
-
-            raw = field.Value
-            scaling = getattr(ch_info, "ScalingFactor", None)
-            if profile_spec.Survey == EDMISurvey.LS03:
-                scaling *= 0.001344
-            if vtype is None:
-                value = raw
-            else:
-                value = _format_channel_value(raw, vtype, scaling)
-
-            item[ch_info.Name] = value
-
+        item["timestamp"] = timestamp
+        item.update(zip(names, values))
         records.append(item)
 
     return records